@@ -15,7 +15,19 @@ CONFIG = PlexConfig(CONFIG_PATH)
 PROJECT = 'PlexAPI'                                 # name provided to plex server
 VERSION = '2.0.2'                                   # version of this api
 TIMEOUT = CONFIG.get('plexapi.timeout', 30, int)    # request timeout
-X_PLEX_CONTAINER_SIZE = 50                          # max results to return in a single search page
+X_PLEX_CONTAINER_SIZE = CONFIG.get('plexapi.container_size', 50, int)          # initial results per page when paging
+X_PLEX_CONTAINER_MIN = CONFIG.get('plexapi.container_size_min', 10, int)       # smallest adaptive page size
+X_PLEX_CONTAINER_MAX = CONFIG.get('plexapi.container_size_max', 1000, int)     # largest adaptive page size
+X_PLEX_CONTAINER_LATENCY = CONFIG.get('plexapi.container_latency', 0.5, float) # target seconds per page
+X_PLEX_CONTAINER_BYTES = CONFIG.get('plexapi.container_bytes', 4194304, int)   # target max bytes per page
+BATCH_SIZE = CONFIG.get('plexapi.batch_size', 100, int)                        # max items per batched metadata request
+LAZY_DECODE = CONFIG.get('plexapi.lazy_decode', 'false') == 'true'             # decode attributes on first access
+KEEP_XML = CONFIG.get('plexapi.keep_xml', 'true') == 'true'                    # media tags keep their xml element
+AUTORELOAD = CONFIG.get('plexapi.autoreload', 'eager')                         # auto reload partial objects (never, missing, eager)
+MAX_WORKERS = CONFIG.get('plexapi.max_workers', 8, int)                        # max concurrent requests per server
+FILTER_TTL = CONFIG.get('plexapi.filter_ttl', 300, int)                        # seconds section filter choices are cached
+SECTION_TTL = CONFIG.get('plexapi.section_ttl', 300, int)                      # seconds library sections are cached
+XML_PARSER = CONFIG.get('plexapi.xml_parser', 'etree')                         # xml parser backend (etree, lxml, expat)
 
 # Plex Header Configuation
 X_PLEX_PROVIDES = 'controller'                                                 # one or more of [player, controller, server]
@@ -1,9 +1,8 @@
 # -*- coding: utf-8 -*-
+from functools import partial
 from plexapi import media, utils
 from plexapi.utils import Playable, PlexPartialObject
 
-NA = utils.NA
-
 
 class Audio(PlexPartialObject):
     """ Base class for audio :class:`~plexapi.audio.Artist`, :class:`~plexapi.audio.Album`
@@ -31,27 +30,24 @@ class Audio(PlexPartialObject):
             viewCount (int): Count of times this item was accessed.
     """
     TYPE = None
+    listType = 'audio'
+    addedAt = utils.Attr(utils.toDatetime)
+    index = utils.Attr(intern=True)
+    key = utils.Attr()
+    lastViewedAt = utils.Attr(utils.toDatetime)
+    librarySectionID = utils.Attr(intern=True)
+    ratingKey = utils.Attr(int)
+    summary = utils.Attr()
+    thumb = utils.Attr()
+    title = utils.Attr()
+    titleSort = utils.Attr(fallback='title')
+    type = utils.Attr(intern=True)
+    updatedAt = utils.Attr(utils.toDatetime)
+    viewCount = utils.Attr(int, 0)
 
     def __init__(self, server, data, initpath):
         super(Audio, self).__init__(data, initpath, server)
 
-    def _loadData(self, data):
-        """ Load attribute values from Plex XML response. """
-        self.listType = 'audio'
-        self.addedAt = utils.toDatetime(data.attrib.get('addedAt', NA))
-        self.index = data.attrib.get('index', NA)
-        self.key = data.attrib.get('key', NA)
-        self.lastViewedAt = utils.toDatetime(data.attrib.get('lastViewedAt', NA))
-        self.librarySectionID = data.attrib.get('librarySectionID', NA)
-        self.ratingKey = utils.cast(int, data.attrib.get('ratingKey', NA))
-        self.summary = data.attrib.get('summary', NA)
-        self.thumb = data.attrib.get('thumb', NA)
-        self.title = data.attrib.get('title', NA)
-        self.titleSort = data.attrib.get('titleSort', self.title)
-        self.type = data.attrib.get('type', NA)
-        self.updatedAt = utils.toDatetime(data.attrib.get('updatedAt', NA))
-        self.viewCount = utils.cast(int, data.attrib.get('viewCount', 0))
-
     @property
     def thumbUrl(self):
         """ Returns the URL to this items thumbnail image. """
@@ -86,18 +82,13 @@ class Artist(Audio):
             similar (list): List of :class:`~plexapi.media.Similar` artists.
     """
     TYPE = 'artist'
-
-    def _loadData(self, data):
-        """ Load attribute values from Plex XML response. """
-        Audio._loadData(self, data)
-        self.art = data.attrib.get('art', NA)
-        self.guid = data.attrib.get('guid', NA)
-        self.key = self.key.replace('/children', '')  # FIX_BUG_50
-        self.location = utils.findLocations(data, single=True)
-        if self.isFullObject():  # check if this is needed
-            self.countries = [media.Country(self.server, e) for e in data if e.tag == media.Country.TYPE]
-            self.genres = [media.Genre(self.server, e) for e in data if e.tag == media.Genre.TYPE]
-            self.similar = [media.Similar(self.server, e) for e in data if e.tag == media.Similar.TYPE]
+    art = utils.Attr()
+    guid = utils.Attr()
+    key = utils.Attr(lambda key: key.replace('/children', ''))  # FIX_BUG_50
+    location = utils.Computed(partial(utils.findLocations, single=True))
+    countries = utils.Elems(media.Country, full=True)
+    genres = utils.Elems(media.Genre, full=True)
+    similar = utils.Elems(media.Similar, full=True)
 
     def albums(self):
         """ Returns a list of :class:`~plexapi.audio.Album` objects by this artist. """
@@ -175,21 +166,16 @@ class Album(Audio):
             year (int): Year this album was released.
     """
     TYPE = 'album'
-
-    def _loadData(self, data):
-        """ Load attribute values from Plex XML response. """
-        Audio._loadData(self, data)
-        self.art = data.attrib.get('art', NA)
-        self.key = self.key.replace('/children', '')  # fixes bug #50
-        self.originallyAvailableAt = utils.toDatetime(data.attrib.get('originallyAvailableAt', NA), '%Y-%m-%d')
-        self.parentKey = data.attrib.get('parentKey', NA)
-        self.parentRatingKey = data.attrib.get('parentRatingKey', NA)
-        self.parentThumb = data.attrib.get('parentThumb', NA)
-        self.parentTitle = data.attrib.get('parentTitle', NA)
-        self.studio = data.attrib.get('studio', NA)
-        self.year = utils.cast(int, data.attrib.get('year', NA))
-        if self.isFullObject():
-            self.genres = [media.Genre(self.server, e) for e in data if e.tag == media.Genre.TYPE]
+    art = utils.Attr()
+    key = utils.Attr(lambda key: key.replace('/children', ''))  # fixes bug #50
+    originallyAvailableAt = utils.Attr(utils.toDatetime, format='%Y-%m-%d')
+    parentKey = utils.Attr(intern=True)
+    parentRatingKey = utils.Attr(intern=True)
+    parentThumb = utils.Attr(intern=True)
+    parentTitle = utils.Attr(intern=True)
+    studio = utils.Attr(intern=True)
+    year = utils.Attr(int)
+    genres = utils.Elems(media.Genre, full=True)
 
     def tracks(self):
         """ Returns a list of :class:`~plexapi.audio.Track` objects in this album. """
@@ -211,7 +197,7 @@ class Album(Audio):
 
     def artist(self):
         """ Return :func:`~plexapi.audio.Artist` of this album. """
-        return utils.listItems(self.server, self.parentKey)[0]
+        return self.server.fetchItem(self.parentKey)
 
     def download(self, savepath=None, keep_orginal_name=False, **kwargs):
         """ Downloads all tracks for this artist to the specified location.
@@ -273,42 +259,27 @@ class Track(Audio, Playable):
                 track (active sessions only).
     """
     TYPE = 'track'
-
-    def _loadData(self, data):
-        """ Load attribute values from Plex XML response. """
-        Audio._loadData(self, data)
-        Playable._loadData(self, data)
-        self.art = data.attrib.get('art', NA)
-        self.chapterSource = data.attrib.get('chapterSource', NA)
-        self.duration = utils.cast(int, data.attrib.get('duration', NA))
-        self.grandparentArt = data.attrib.get('grandparentArt', NA)
-        self.grandparentKey = data.attrib.get('grandparentKey', NA)
-        self.grandparentRatingKey = data.attrib.get('grandparentRatingKey', NA)
-        self.grandparentThumb = data.attrib.get('grandparentThumb', NA)
-        self.grandparentTitle = data.attrib.get('grandparentTitle', NA)
-        self.guid = data.attrib.get('guid', NA)
-        self.originalTitle = data.attrib.get('originalTitle', NA)
-        self.parentIndex = data.attrib.get('parentIndex', NA)
-        self.parentKey = data.attrib.get('parentKey', NA)
-        self.parentRatingKey = data.attrib.get('parentRatingKey', NA)
-        self.parentThumb = data.attrib.get('parentThumb', NA)
-        self.parentTitle = data.attrib.get('parentTitle', NA)
-        self.primaryExtraKey = data.attrib.get('primaryExtraKey', NA)
-        self.ratingCount = utils.cast(int, data.attrib.get('ratingCount', NA))
-        self.viewOffset = utils.cast(int, data.attrib.get('viewOffset', 0))
-        self.year = utils.cast(int, data.attrib.get('year', NA))
-        # media is included in /children
-        self.media = [media.Media(self.server, e, self.initpath, self)
-            for e in data if e.tag == media.Media.TYPE]
-        if self.isFullObject():  # check me
-            self.moods = [media.Mood(self.server, e) for e in data if e.tag == media.Mood.TYPE]
-            #self.media = [media.Media(self.server, e, self.initpath, self)
-            #              for e in data if e.tag == media.Media.TYPE]
-        # data for active sessions and history
-        self.sessionKey = utils.cast(int, data.attrib.get('sessionKey', NA))
-        self.username = utils.findUsername(data)
-        self.player = utils.findPlayer(self.server, data)
-        self.transcodeSession = utils.findTranscodeSession(self.server, data)
+    art = utils.Attr()
+    chapterSource = utils.Attr()
+    duration = utils.Attr(int)
+    grandparentArt = utils.Attr(intern=True)
+    grandparentKey = utils.Attr(intern=True)
+    grandparentRatingKey = utils.Attr(intern=True)
+    grandparentThumb = utils.Attr(intern=True)
+    grandparentTitle = utils.Attr(intern=True)
+    guid = utils.Attr()
+    originalTitle = utils.Attr()
+    parentIndex = utils.Attr(intern=True)
+    parentKey = utils.Attr(intern=True)
+    parentRatingKey = utils.Attr(intern=True)
+    parentThumb = utils.Attr(intern=True)
+    parentTitle = utils.Attr(intern=True)
+    primaryExtraKey = utils.Attr()
+    ratingCount = utils.Attr(int)
+    viewOffset = utils.Attr(int, 0)
+    year = utils.Attr(int)
+    moods = utils.Elems(media.Mood, full=True)
+    media = utils.Elems(media.Media, parent=True)  # included in /children; last, it hides the media module
 
     @property
     def thumbUrl(self):
@@ -318,11 +289,11 @@ class Track(Audio, Playable):
 
     def album(self):
         """ Return this track's :class:`~plexapi.audio.Album`. """
-        return utils.listItems(self.server, self.parentKey)[0]
+        return self.server.fetchItem(self.parentKey)
 
     def artist(self):
         """ Return this track's :class:`~plexapi.audio.Artist`. """
-        return utils.listItems(self.server, self.grandparentKey)[0]
+        return self.server.fetchItem(self.grandparentKey)
 
     def _prettyfilename(self):
         """ Returns a filename for use in download. """
@@ -3,7 +3,6 @@ import requests
 from requests.status_codes import _codes as codes
 from plexapi import BASE_HEADERS, TIMEOUT, log, utils
 from plexapi.exceptions import BadRequest, NotFound, Unsupported
-from xml.etree import ElementTree
 
 
 class PlexClient(object):
@@ -127,8 +126,7 @@ class PlexClient(object):
         if response.status_code not in [200, 201]:
             codename = codes.get(response.status_code)[0]
             raise BadRequest('(%s) %s' % (response.status_code, codename))
-        data = response.text.encode('utf8')
-        return ElementTree.fromstring(data) if data else None
+        return utils.parseXML(response.content)
 
     def sendCommand(self, command, proxy=None, **params):
         """ Convenience wrapper around :func:`~plexapi.client.PlexClient.query()` to more easily
@@ -27,8 +27,33 @@ try:
 except ImportError:
     from ConfigParser import ConfigParser
 
+try:
+    from sys import intern
+except ImportError:
+    import __builtin__
+
+    def intern(value):
+        # Python 2 only interns byte strings.
+        return __builtin__.intern(value) if isinstance(value, str) else value
+
 try:
     from xml.etree import cElementTree as ElementTree
 except ImportError:
     from xml.etree import ElementTree
-    
\ No newline at end of file
+
+try:
+    from lxml import etree as lxml
+except ImportError:
+    lxml = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def with_metaclass(meta, *bases):
+    """ Returns a base class that creates subclasses with the specified metaclass. The base
+        class adds no instance __dict__, so the subclasses are free to use __slots__.
+    """
+    return meta('temporary_class', bases or (object,), {'__slots__': ()})
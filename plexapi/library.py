@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
-import logging
-from plexapi import X_PLEX_CONTAINER_SIZE, log, utils
-from plexapi.compat import unquote
+import logging, time
+from collections import Counter, OrderedDict
+from threading import Lock
+from plexapi import FILTER_TTL, SECTION_TTL, log, utils
+from plexapi.compat import unquote, urlencode
 from plexapi.media import MediaTag, Genre, Role, Director
 from plexapi.exceptions import BadRequest, NotFound
 
@@ -24,7 +26,8 @@ class Library(object):
         self.server = server
         self.title1 = data.attrib.get('title1')
         self.title2 = data.attrib.get('title2')
-        self._sectionsByID = {}  # cached Section UUIDs
+        self._sections = None  # cached SectionRegistry
+        self._sectionsByID = {}  # sections by key of the last listing, kept when the cache is off
 
     def __repr__(self):
         return '<Library:%s>' % self.title1.encode('utf8')
@@ -33,23 +36,29 @@ class Library(object):
         """ Returns a list of all media sections in this library. Library sections may be any of
             :class:`~plexapi.library.MovieSection`, :class:`~plexapi.library.ShowSection`,
             :class:`~plexapi.library.MusicSection`, :class:`~plexapi.library.PhotoSection`.
+            Sections are cached for `plexapi.section_ttl` seconds (0 disables the cache), see
+            :func:`~plexapi.library.Library.clearSectionCache()`.
         """
-        items = []
-        SECTION_TYPES = {
-            MovieSection.TYPE: MovieSection,
-            ShowSection.TYPE: ShowSection,
-            MusicSection.TYPE: MusicSection,
-            PhotoSection.TYPE: PhotoSection,
-        }
-        path = '/library/sections'
-        for elem in self.server.query(path):
-            stype = elem.attrib['type']
-            if stype in SECTION_TYPES:
-                cls = SECTION_TYPES[stype]
-                section = cls(self.server, elem, path)
-                self._sectionsByID[section.key] = section
-                items.append(section)
-        return items
+        return list(self._registry().sections)
+
+    def _registry(self, reload=False):
+        # Returns the cached SectionRegistry, listing the sections again once it expired.
+        registry = self._sections
+        if reload or registry is None or registry.expires <= time.time():
+            registry = SectionRegistry(self.server, time.time() + SECTION_TTL)
+            self._sections = registry if SECTION_TTL > 0 else None
+            self._sectionsByID = dict(registry.byKey)
+        return registry
+
+    def _lookup(self, index, value):
+        # Looks value up in the named index of the registry, reloading it once on a miss
+        # in case the section was added since it was cached.
+        section = getattr(self._registry(), index).get(value)
+        if section is None:
+            section = getattr(self._registry(reload=True), index).get(value)
+        if section is None:
+            raise NotFound('Invalid library section: %s' % value)
+        return section
 
     def section(self, title=None):
         """ Returns the :class:`~plexapi.library.LibrarySection` that matches the specified title.
@@ -60,44 +69,143 @@ class Library(object):
             Raises:
                 :class:`~plexapi.exceptions.NotFound`: Invalid library section title.
         """
-        for item in self.sections():
-            if item.title == title:
-                return item
-        raise NotFound('Invalid library section: %s' % title)
+        return self._lookup('byTitle', title)
 
     def sectionByID(self, sectionID):
         """ Returns the :class:`~plexapi.library.LibrarySection` that matches the specified sectionID.
 
             Parameters:
                 sectionID (str): ID of the section to return.
+
+            Raises:
+                :class:`~plexapi.exceptions.NotFound`: Invalid library section ID.
         """
-        if not self._sectionsByID or sectionID not in self._sectionsByID:
-            self.sections()
-        return self._sectionsByID[sectionID]
+        return self._lookup('byKey', str(sectionID))
 
-    def all(self):
+    def sectionByUUID(self, uuid):
+        """ Returns the :class:`~plexapi.library.LibrarySection` that matches the specified uuid.
+
+            Parameters:
+                uuid (str): UUID of the section to return.
+
+            Raises:
+                :class:`~plexapi.exceptions.NotFound`: Invalid library section UUID.
+        """
+        return self._lookup('byUUID', uuid)
+
+    def clearSectionCache(self):
+        """ Forgets the cached sections, so the next lookup lists them from the server again.
+            Called by :func:`~plexapi.library.Library.refresh()`,
+            :func:`~plexapi.library.Library.add()` and
+            :func:`~plexapi.library.LibrarySection.delete()`.
+        """
+        self._sections = None
+
+    def add(self, name, type, agent, scanner, location, language='en', **kwargs):
+        """ Creates a new library section and returns it.
+
+            Parameters:
+                name (str): Title of the new section.
+                type (str): Type of the section (movie, show, artist, photo).
+                agent (str): Metadata agent (ex: com.plexapp.agents.imdb).
+                scanner (str): Scanner used to find media (ex: Plex Movie Scanner).
+                location (str): Path on the server where the section content is stored.
+                language (str): Metadata language (default en).
+                **kwargs (dict): Additional section settings passed to the server.
+        """
+        args = dict(kwargs, name=name, type=type, agent=agent, scanner=scanner,
+            location=location, language=language)
+        self.server.query('/library/sections?%s' % urlencode(args), method=self.server.session.post)
+        self.clearSectionCache()
+        return self.section(name)
+
+    def stats(self):
+        """ Returns the :class:`~plexapi.library.LibraryStats` of all library sections,
+            gathered from the sections concurrently. See
+            :func:`~plexapi.library.LibrarySection.stats()`.
+        """
+        stats = LibraryStats()
+        for sectionStats in utils.mapThreaded(lambda section: section.stats(), self.sections()):
+            stats.update(sectionStats)
+        return stats
+
+    def all(self, containerSize=None):
         """ Returns a list of all media from all library sections.
-            This may be a very large dataset to retrieve.
+            This may be a very large dataset to retrieve. The sections and their pages are
+            requested concurrently, see :func:`~plexapi.library.Library.iterAll()`.
+
+            Parameters:
+                containerSize (int): Fixed number of results to request per page (optional).
         """
-        return [item for section in self.sections() for item in section.all()]
+        return list(self.iterAll(containerSize))
 
-    def onDeck(self):
-        """ Returns a list of all media items on deck. """
-        return utils.listItems(self.server, '/library/onDeck')
+    def iterAll(self, containerSize=None):
+        """ Same as :func:`~plexapi.library.Library.all()` but returns a generator that yields
+            the media section after section as their pages arrive. The pages of all sections
+            are requested at once (up to `plexapi.max_workers` at a time), so the crawl takes
+            about as long as the largest section. See :func:`~plexapi.utils.crawlItems()`.
 
-    def recentlyAdded(self):
-        """ Returns a list of all media items recently added. """
-        return utils.listItems(self.server, '/library/recentlyAdded')
+            Parameters:
+                containerSize (int): Fixed number of results to request per page (optional).
+        """
+        paths = ['/library/sections/%s/all' % section.key for section in self.sections()]
+        return utils.crawlItems(self.server, paths, containerSize=containerSize)
+
+    def onDeck(self, maxresults=None, containerSize=None):
+        """ Returns a list of all media items on deck.
+
+            Parameters:
+                maxresults (int): Max number of items to return, requested in batches (default
+                    the single response of the server).
+                containerSize (int): Fixed number of results to request per batch (optional).
+        """
+        if maxresults is None:
+            return utils.listItems(self.server, '/library/onDeck')
+        return utils.listPagedItems(self.server, '/library/onDeck', maxresults, containerSize)
+
+    def recentlyAdded(self, maxresults=None, containerSize=None):
+        """ Returns a list of all media items recently added.
 
-    def get(self, title):  # this should use hub search when its merged
-        """ Return the first item from all items with the specified title.
+            Parameters:
+                maxresults (int): Max number of items to return, requested in batches (default
+                    the single response of the server).
+                containerSize (int): Fixed number of results to request per batch (optional).
+        """
+        if maxresults is None:
+            return utils.listItems(self.server, '/library/recentlyAdded')
+        return utils.listPagedItems(self.server, '/library/recentlyAdded', maxresults, containerSize)
+
+    def get(self, title, index=None):
+        """ Return the first item from all items with the specified title (ignoring case and
+            repeated whitespace), or None if there is none. Each section is searched for the
+            title on the server, all sections at once. Pass an index to answer from a local
+            snapshot instead, see :func:`~plexapi.library.Library.titleIndex()`.
 
             Parameters:
                 title (str): Title of the item to return.
+                index (:class:`~plexapi.library.TitleIndex`): Snapshot to lookup title in (optional).
         """
-        for i in self.all():
-            if i.title.lower() == title.lower():
-                return i
+        if index is not None:
+            return index.get(title)
+        norm = normalizeTitle(title)
+
+        def find(section):
+            path = '/library/sections/%s/all%s' % (section.key, utils.joinArgs({'title': ' '.join(title.split())}))
+            for elem in utils.iterElems(self.server, path):
+                if normalizeTitle(elem.attrib.get('title')) == norm:
+                    return utils.buildItem(self.server, elem, path)
+        for item in utils.mapThreaded(find, self.sections()):
+            if item is not None:
+                return item
+
+    def titleIndex(self, items=None):
+        """ Returns a :class:`~plexapi.library.TitleIndex` snapshot of items (all items from
+            all library sections by default) to answer repeated title lookups locally.
+
+            Parameters:
+                items (list): Items to index (optional).
+        """
+        return TitleIndex(self.all() if items is None else items)
 
     def getByKey(self, key):
         """ Return the first item from all items with the specified key.
@@ -107,7 +215,7 @@ class Library(object):
         """
         return utils.findKey(self.server, key)
 
-    def search(self, title=None, libtype=None, **kwargs):
+    def search(self, title=None, libtype=None, fields=None, as_records=False, **kwargs):
         """ Searching within a library section is much more powerful. It seems certain
             attributes on the media objects can be targeted to filter this search down
             a bit, but I havent found the documentation for it.
@@ -115,6 +223,8 @@ class Library(object):
             Example: "studio=Comedy%20Central" or "year=1999" "title=Kung Fu" all work. Other items
             such as actor=<id> seem to work, but require you already know the id of the actor.
             TLDR: This is untested but seems to work. Use library section search when you can.
+            Set fields or as_records to get records instead of objects (see
+            :func:`~plexapi.utils.buildRecord()`).
         """
         args = {}
         if title:
@@ -124,7 +234,14 @@ class Library(object):
         for attr, value in kwargs.items():
             args[attr] = value
         query = '/library/all%s' % utils.joinArgs(args)
-        return utils.listItems(self.server, query)
+        return utils.listItems(self.server, query, fields=fields, as_records=as_records)
+
+    def searchAsync(self, title=None, libtype=None, **kwargs):
+        """ Same as :func:`~plexapi.library.Library.search()` but returns immediately with an
+            :class:`~multiprocessing.pool.AsyncResult`. Call `get()` on the result to wait for
+            the list of matching items.
+        """
+        return self.server.pool.apply_async(self.search, (title, libtype), kwargs)
 
     def cleanBundles(self):
         """ Poster images and other metadata for items in your library are kept in "bundle"
@@ -151,12 +268,82 @@ class Library(object):
         """ Refresh the metadata for the entire library. This will fetch fresh metadata for
             all contents in the library, including items that already have metadata.
         """
+        for section in self._sectionsByID.values():
+            section.clearFilterCache()
+        self.clearSectionCache()
         self.server.query('/library/sections/all/refresh')
 
     def __len__(self):
         return len(self.sections())
 
 
+def normalizeTitle(title):
+    """ Returns title lowercased and with whitespace collapsed, to compare titles. """
+    return ' '.join((title or '').lower().split())
+
+
+class TitleIndex(object):
+    """ Hash index of items by normalized title, see :func:`~plexapi.library.Library.get()`.
+
+        Parameters:
+            items (list): Items to index (anything with a title).
+    """
+
+    def __init__(self, items):
+        self._titles = {}
+        for item in items:
+            self._titles.setdefault(normalizeTitle(item.title), []).append(item)
+
+    def __len__(self):
+        return sum(len(items) for items in self._titles.values())
+
+    def get(self, title):
+        """ Returns the first indexed item with the specified title, or None. """
+        items = self._titles.get(normalizeTitle(title))
+        return items[0] if items else None
+
+    def getAll(self, title):
+        """ Returns the list of indexed items with the specified title. """
+        return list(self._titles.get(normalizeTitle(title), ()))
+
+
+class SectionRegistry(object):
+    """ Snapshot of the library sections of a server, indexed for lookups. See
+        :func:`~plexapi.library.Library.sections()`.
+
+        Parameters:
+            server (:class:`~plexapi.server.PlexServer`): PlexServer to list the sections from.
+            expires (float): Time after which the sections have to be listed again.
+
+        Attributes:
+            byKey (dict): {key: section} of all sections.
+            byTitle (dict): {title: section} of all sections.
+            byUUID (dict): {uuid: section} of all sections.
+            expires (float): Time after which the sections have to be listed again.
+            sections (list): All sections, in server order.
+    """
+
+    def __init__(self, server, expires=0):
+        SECTION_TYPES = {
+            MovieSection.TYPE: MovieSection,
+            ShowSection.TYPE: ShowSection,
+            MusicSection.TYPE: MusicSection,
+            PhotoSection.TYPE: PhotoSection,
+        }
+        self.expires = expires
+        self.sections = []
+        path = '/library/sections'
+        for elem in server.query(path):
+            cls = SECTION_TYPES.get(elem.attrib['type'])
+            if cls is not None:
+                self.sections.append(cls(server, elem, path))
+        self.byKey = {s.key: s for s in self.sections}
+        self.byUUID = {s.uuid: s for s in self.sections}
+        self.byTitle = {}
+        for section in reversed(self.sections):
+            self.byTitle[section.title] = section  # first section wins on duplicate titles
+
+
 class LibrarySection(object):
     """ Base class for a single library section.
 
@@ -188,6 +375,7 @@ class LibrarySection(object):
     ALLOWED_FILTERS = ()
     ALLOWED_SORT = ()
     BOOLEAN_FILTERS = ('unwatched', 'duplicate')
+    MEDIATYPE = None
 
     def __init__(self, server, data, initpath):
         self._data = data
@@ -209,6 +397,7 @@ class LibrarySection(object):
         self.type = data.attrib.get('type')
         self.updatedAt = utils.toDatetime(data.attrib.get('updatedAt'))
         self.uuid = data.attrib.get('uuid')
+        self._filterChoices = {}  # cached (category, libtype) -> FilterLookup
 
     def __repr__(self):
         title = self.title.replace(' ', '.')[0:20]
@@ -227,17 +416,35 @@ class LibrarySection(object):
         """ Returns a list of media from this library section. """
         return utils.listItems(self.server, '/library/sections/%s/all' % self.key)
 
-    def onDeck(self):
-        """ Returns a list of media items on deck from this library section. """
-        return utils.listItems(self.server, '/library/sections/%s/onDeck' % self.key)
+    def stats(self):
+        """ Returns the :class:`~plexapi.library.LibraryStats` of the media in this section.
+            The listing of the items holding media (movies, episodes, tracks or photos) is
+            streamed and summed up as it is parsed, without building objects, so memory use
+            stays flat however large the section is.
+        """
+        stats = LibraryStats()
+        path = '/library/sections/%s/all?type=%s' % (self.key, self.MEDIATYPE)
+        for elem in utils.iterElems(self.server, path):
+            stats.add(elem)
+        return stats
+
+    def onDeck(self, containerSize=None):
+        """ Returns a list of media items on deck from this library section.
+
+            Parameters:
+                containerSize (int): Fixed number of results to request per batch (optional).
+        """
+        path = '/library/sections/%s/onDeck' % self.key
+        return utils.listPagedItems(self.server, path, containerSize=containerSize)
 
-    def recentlyAdded(self, maxresults=50):
+    def recentlyAdded(self, maxresults=50, containerSize=None):
         """ Returns a list of media items recently added from this library section.
 
             Parameters:
                 maxresults (int): Max number of items to return (default 50).
+                containerSize (int): Fixed number of results to request per batch (optional).
         """
-        return self.search(sort='addedAt:desc', maxresults=maxresults)
+        return self.search(sort='addedAt:desc', maxresults=maxresults, containerSize=containerSize)
 
     def analyze(self):
         """ Run an analysis on all of the items in this library section. """
@@ -251,8 +458,15 @@ class LibrarySection(object):
         """ Refresh the metadata for this library section. This will fetch fresh metadata for
             all contents in the section, including items that already have metadata.
         """
+        self._filterChoices.clear()
         self.server.query('/library/sections/%s/refresh' % self.key)
 
+    def delete(self):
+        """ Deletes this library section from the server (the media files are kept). """
+        self.server.query('/library/sections/%s' % self.key, method=self.server.session.delete)
+        self.server.library._sectionsByID.pop(self.key, None)
+        self.server.library.clearSectionCache()
+
     def listChoices(self, category, libtype=None, **kwargs):
         """ Returns a list of :class:`~plexapi.library.FilterChoice` objects for the
             specified category and libtype. kwargs can be any of the same kwargs in
@@ -277,10 +491,13 @@ class LibrarySection(object):
         query = '/library/sections/%s/%s%s' % (self.key, category, utils.joinArgs(args))
         return utils.listItems(self.server, query, bytag=True)
 
-    def search(self, title=None, sort=None, maxresults=999999, libtype=None, **kwargs):
+    def search(self, title=None, sort=None, maxresults=999999, libtype=None, containerSize=None,
+               fields=None, as_records=False, columns=None, as_arrays=False, **kwargs):
         """ Search the library. If there are many results, they will be fetched from the server
-            in batches of X_PLEX_CONTAINER_SIZE amounts. If you're only looking for the first <num>
-            results, it would be wise to set the maxresults option to that amount so this functions
+            in batches sized by the server's adaptive :class:`~plexapi.utils.Pager`. After the
+            first batch, the remaining batches are requested concurrently (up to
+            `plexapi.max_workers` at once). If you're only looking for the first <num> results,
+            it would be wise to set the maxresults option to that amount so this functions
             doesn't iterate over all results on the server.
 
             Parameters:
@@ -289,6 +506,14 @@ class LibrarySection(object):
                       titleSort, rating, mediaHeight, duration}. dir can be asc or desc (optional).
                 maxresults (int): Only return the specified number of results (optional).
                 libtype (str): Filter results to a spcifiec libtype (movie, show, episode, artist, album, track; optional).
+                containerSize (int): Fixed number of results to request per batch (optional).
+                fields (list<str>): Return records of only these attributes instead of objects
+                    (see :func:`~plexapi.utils.buildRecord()`; optional).
+                as_records (bool): Return records of all attributes instead of objects.
+                columns (list<str>): Return an OrderedDict of {column: values} for these
+                    attributes instead of objects (see :func:`~plexapi.utils.listColumns()`;
+                    optional).
+                as_arrays (bool): Return the columns as NumPy arrays (or `array.array`).
                 **kwargs (dict): Any of the available filters for the current library section. Partial string
                         matches allowed. Multiple matches OR together. All inputs will be compared with the
                         available options and a warning logged if the option does not appear valid.
@@ -307,7 +532,32 @@ class LibrarySection(object):
                         * studio: List of studios to search within ([studio_or_key, ...]). [music]
                         * year: List of years to search within ([yyyy, ...]). [all]
         """
-        # Cleanup the core arguments
+        args = self._cleanSearchArgs(title, sort, libtype, **kwargs)
+        query = '/library/sections/%s/all%s' % (self.key, utils.joinArgs(args))
+        if columns:
+            return utils.listColumns(self.server, query, columns, maxresults, containerSize, as_arrays)
+        return utils.listPagedItems(self.server, query, maxresults, containerSize, fields, as_records)
+
+    def iterSearch(self, title=None, sort=None, maxresults=999999, libtype=None, containerSize=None,
+                   fields=None, as_records=False, **kwargs):
+        """ Same as :func:`~plexapi.library.LibrarySection.search()` but returns a generator
+            that yields the results page by page. While you process one page, the next page
+            is fetched in the background. Stop iterating once you have what you need and
+            no further pages will be requested.
+        """
+        args = self._cleanSearchArgs(title, sort, libtype, **kwargs)
+        query = '/library/sections/%s/all%s' % (self.key, utils.joinArgs(args))
+        return utils.iterPagedItems(self.server, query, maxresults, containerSize, fields, as_records)
+
+    def searchAsync(self, title=None, sort=None, maxresults=999999, libtype=None, containerSize=None, **kwargs):
+        """ Same as :func:`~plexapi.library.LibrarySection.search()` but returns immediately
+            with an :class:`~multiprocessing.pool.AsyncResult`. Call `get()` on the result to
+            wait for the list of matching items. Useful to search several sections at once.
+        """
+        return self.server.pool.apply_async(self.search, (title, sort, maxresults, libtype, containerSize), kwargs)
+
+    def _cleanSearchArgs(self, title=None, sort=None, libtype=None, **kwargs):
+        # Returns the cleaned up query string arguments for a search.
         # TODO: maxresults is raising a 500 error here.
         args = {}
         for category, value in kwargs.items():
@@ -318,17 +568,7 @@ class LibrarySection(object):
             args['sort'] = self._cleanSearchSort(sort)
         if libtype is not None:
             args['type'] = utils.searchType(libtype)
-        # Iterate over the results
-        results, subresults = [], '_init'
-        args['X-Plex-Container-Start'] = 0
-        args['X-Plex-Container-Size'] = min(X_PLEX_CONTAINER_SIZE, maxresults)
-        while subresults and maxresults > len(results):
-            query = '/library/sections/%s/all%s' % (
-                self.key, utils.joinArgs(args))
-            subresults = utils.listItems(self.server, query)
-            results += subresults[:maxresults - len(results)]
-            args['X-Plex-Container-Start'] += args['X-Plex-Container-Size']
-        return results
+        return args
 
     def _cleanSearchFilter(self, category, value, libtype=None):
         # check a few things before we begin
@@ -340,27 +580,46 @@ class LibrarySection(object):
             value = [value]
         # convert list of values to list of keys or ids
         result = set()
-        choices = self.listChoices(category, libtype)
-        lookup = {c.title.lower(): unquote(unquote(c.key)) for c in choices}
-        allowed = set(c.key for c in choices)
+        lookup = self.filterLookup(category, libtype)
         for item in value:
             item = str(item.id if isinstance(item, MediaTag) else item).lower()
             # find most logical choice(s) to use in url
-            if item in allowed:
-                result.add(item)
-                continue
-            if item in lookup:
-                result.add(lookup[item])
-                continue
-            matches = [k for t, k in lookup.items() if item in t]
+            matches = lookup.resolve(item)
             if matches:
-                map(result.add, matches)
+                result.update(matches)
                 continue
             # nothing matched; use raw item value
             log.warning('Filter value not listed, using raw item value: %s' % item)
             result.add(item)
         return ','.join(result)
 
+    def filterLookup(self, category, libtype=None):
+        """ Returns the :class:`~plexapi.library.FilterLookup` of the choices for the specified
+            category and libtype. Lookups are cached on this section for `plexapi.filter_ttl`
+            seconds (0 disables the cache), so repeated searches resolve their filters without
+            listing the choices again. The cache is cleared by
+            :func:`~plexapi.library.LibrarySection.refresh()` and
+            :func:`~plexapi.library.LibrarySection.clearFilterCache()`.
+
+            Parameters:
+                category (str): Category to lookup choices for (genre, contentRating, etc).
+                libtype (int): Library type of item filter.
+        """
+        key = (category, libtype)
+        lookup = self._filterChoices.get(key)
+        if lookup is None or lookup.expires <= time.time():
+            choices = self.listChoices(category, libtype)
+            lookup = FilterLookup(choices, time.time() + FILTER_TTL)
+            if FILTER_TTL > 0:
+                self._filterChoices[key] = lookup
+        return lookup
+
+    def clearFilterCache(self):
+        """ Forgets the cached filter choices of this section, see
+            :func:`~plexapi.library.LibrarySection.filterLookup()`.
+        """
+        self._filterChoices.clear()
+
     def _cleanSearchSort(self, sort):
         sort = '%s:asc' % sort if ':' not in sort else sort
         scol, sdir = sort.lower().split(':')
@@ -383,12 +642,14 @@ class MovieSection(LibrarySection):
                 'originallyAvailableAt', 'lastViewedAt', 'titleSort', 'rating',
                 'mediaHeight', 'duration')
             TYPE (str): 'movie'
+            MEDIATYPE (int): 1 (search type of movies, the items holding media).
     """
     ALLOWED_FILTERS = ('unwatched', 'duplicate', 'year', 'decade', 'genre', 'contentRating',
         'collection', 'director', 'actor', 'country', 'studio', 'resolution')
     ALLOWED_SORT = ('addedAt', 'originallyAvailableAt', 'lastViewedAt', 'titleSort', 'rating',
         'mediaHeight', 'duration')
     TYPE = 'movie'
+    MEDIATYPE = 1
 
 
 class ShowSection(LibrarySection):
@@ -400,11 +661,13 @@ class ShowSection(LibrarySection):
             ALLOWED_SORT (list<str>): List of allowed sorting keys. ('addedAt', 'lastViewedAt',
                 'originallyAvailableAt', 'titleSort', 'rating', 'unwatched')
             TYPE (str): 'show'
+            MEDIATYPE (int): 4 (search type of episodes, the items holding media).
     """
     ALLOWED_FILTERS = ('unwatched', 'year', 'genre', 'contentRating', 'network', 'collection')
     ALLOWED_SORT = ('addedAt', 'lastViewedAt', 'originallyAvailableAt', 'titleSort',
         'rating', 'unwatched')
     TYPE = 'show'
+    MEDIATYPE = 4
 
     def searchShows(self, **kwargs):
         """ Search for a show. See :func:`~plexapi.library.LibrarySection.search()` for usage. """
@@ -414,13 +677,15 @@ class ShowSection(LibrarySection):
         """ Search for an episode. See :func:`~plexapi.library.LibrarySection.search()` for usage. """
         return self.search(libtype='episode', **kwargs)
 
-    def recentlyAdded(self, libtype='episode', maxresults=50):
+    def recentlyAdded(self, libtype='episode', maxresults=50, containerSize=None):
         """ Returns a list of recently added episodes from this library section.
 
             Parameters:
                 maxresults (int): Max number of items to return (default 50).
+                containerSize (int): Fixed number of results to request per batch (optional).
         """
-        return self.search(sort='addedAt:desc', libtype=libtype, maxresults=maxresults)
+        return self.search(sort='addedAt:desc', libtype=libtype, maxresults=maxresults,
+            containerSize=containerSize)
 
 
 class MusicSection(LibrarySection):
@@ -432,10 +697,12 @@ class MusicSection(LibrarySection):
             ALLOWED_SORT (list<str>): List of allowed sorting keys. ('addedAt',
                 'lastViewedAt', 'viewCount', 'titleSort')
             TYPE (str): 'artist'
+            MEDIATYPE (int): 10 (search type of tracks, the items holding media).
     """
     ALLOWED_FILTERS = ('genre', 'country', 'collection')
     ALLOWED_SORT = ('addedAt', 'lastViewedAt', 'viewCount', 'titleSort')
     TYPE = 'artist'
+    MEDIATYPE = 10
 
     def albums(self):
         """ Returns a list of :class:`~plexapi.audio.Album` objects in this section. """
@@ -461,10 +728,12 @@ class PhotoSection(LibrarySection):
             ALLOWED_FILTERS (list<str>): List of allowed search filters. <NONE>
             ALLOWED_SORT (list<str>): List of allowed sorting keys. <NONE>
             TYPE (str): 'photo'
+            MEDIATYPE (int): 13 (search type of photos, the items holding media).
     """
     ALLOWED_FILTERS = ('all', 'iso', 'make', 'lens', 'aperture', 'exposure')
     ALLOWED_SORT = ()
     TYPE = 'photo'
+    MEDIATYPE = 13
 
     def searchAlbums(self, title, **kwargs): # lets use this for now.
         """ Search for an album. See :func:`~plexapi.library.LibrarySection.search()` for usage. """
@@ -477,6 +746,114 @@ class PhotoSection(LibrarySection):
         return [i for i in photos if i.title.lower() == title.lower()]
 
 
+class FilterLookup(object):
+    """ Prebuilt lookups over the :class:`~plexapi.library.FilterChoice` objects of a search
+        filter, see :func:`~plexapi.library.LibrarySection.filterLookup()`.
+
+        Parameters:
+            choices (list): :class:`~plexapi.library.FilterChoice` objects to lookup.
+            expires (float): Time after which the choices have to be listed again.
+
+        Attributes:
+            expires (float): Time after which the choices have to be listed again.
+            keys (set): Keys of all choices.
+            titles (dict): {lowercase title: unquoted key} of all choices.
+    """
+    PARTIAL_MAX = 64  # substring matches remembered, least recently used are dropped
+
+    def __init__(self, choices, expires=0):
+        self.expires = expires
+        self.keys = set(c.key for c in choices)
+        self.titles = {c.title.lower(): unquote(unquote(c.key)) for c in choices}
+        self._partial = OrderedDict()  # value -> keys of the titles containing it
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self.keys)
+
+    def resolve(self, value):
+        """ Returns the list of keys matching value: the key itself, the key of the choice
+            titled value, or else the keys of all choices with value in their title.
+
+            Parameters:
+                value (str): Lowercase key or title to resolve.
+        """
+        if value in self.keys:
+            return [value]
+        if value in self.titles:
+            return [self.titles[value]]
+        with self._lock:
+            matches = self._partial.pop(value, None)
+            if matches is None:
+                matches = [k for t, k in self.titles.items() if value in t]
+            self._partial[value] = matches  # move to the end (most recently used)
+            if len(self._partial) > self.PARTIAL_MAX:
+                self._partial.popitem(last=False)
+            return matches
+
+
+class LibraryStats(object):
+    """ Storage and codec statistics of library items, see
+        :func:`~plexapi.library.LibrarySection.stats()`.
+
+        Attributes:
+            items (int): Number of items (movies, episodes, tracks or photos).
+            media (int): Number of media (versions) of these items.
+            parts (int): Number of media parts (files).
+            size (int): Total size of the media parts in bytes.
+            duration (int): Total duration of the items in milliseconds.
+            audioCodecs (Counter): Number of media by audio codec (ex: {'aac': 12}).
+            containers (Counter): Number of media by container (ex: {'mkv': 10}).
+            videoCodecs (Counter): Number of media by video codec (ex: {'h264': 9}).
+            videoResolutions (Counter): Number of media by video resolution (ex: {'1080': 4}).
+    """
+    COUNTERS = (('audioCodec', 'audioCodecs'), ('container', 'containers'),
+        ('videoCodec', 'videoCodecs'), ('videoResolution', 'videoResolutions'))
+
+    def __init__(self):
+        self.items = 0
+        self.media = 0
+        self.parts = 0
+        self.size = 0
+        self.duration = 0
+        for attr, name in self.COUNTERS:
+            setattr(self, name, Counter())
+
+    def __repr__(self):
+        return '<%s:%s items:%s bytes>' % (self.__class__.__name__, self.items, self.size)
+
+    def add(self, elem):
+        """ Adds the item of the XML element elem (with its Media and Part elements). """
+        self.items += 1
+        self.duration += _toInt(elem.attrib.get('duration'))
+        for media in elem.findall('Media'):
+            self.media += 1
+            for attr, name in self.COUNTERS:
+                value = media.attrib.get(attr)
+                if value:
+                    getattr(self, name)[value] += 1
+            for part in media.findall('Part'):
+                self.parts += 1
+                self.size += _toInt(part.attrib.get('size'))
+
+    def update(self, other):
+        """ Adds the statistics of other to these. """
+        self.items += other.items
+        self.media += other.media
+        self.parts += other.parts
+        self.size += other.size
+        self.duration += other.duration
+        for attr, name in self.COUNTERS:
+            getattr(self, name).update(getattr(other, name))
+
+
+def _toInt(value):
+    try:
+        return int(value or 0)
+    except ValueError:
+        return 0
+
+
 @utils.register_libtype
 class Hub(object):
     TYPE = 'Hub'
@@ -543,3 +920,4 @@ class FilterChoice(object):
     def __repr__(self):
         title = self.title.replace(' ', '.')[0:20]
         return '<%s:%s:%s>' % (self.__class__.__name__, self.key, title)
+
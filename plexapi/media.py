@@ -1,9 +1,16 @@
 # -*- coding: utf-8 -*-
+import weakref
 from plexapi.exceptions import BadRequest
-from plexapi.utils import cast, listItems
+from plexapi.utils import Attr, Elems, PlexObject, cast, listItems
 
 
-class Media(object):
+def _parentRef(parent):
+    # Parents are held weakly, so the media objects of an item have no reference cycle
+    # back to it and are freed with it by refcounting.
+    return weakref.ref(parent) if parent is not None else lambda: None
+
+
+class Media(PlexObject):
     """ Container object for all MediaPart objects. Provides useful data about the
         video this media belong to such as video framerate, resolution, etc.
 
@@ -16,7 +23,8 @@ class Media(object):
         Attributes:
             server (:class:`~plexapi.server.PlexServer`): PlexServer object this is from.
             initpath (str): Relative path requested when retrieving specified data.
-            video (str): Video this media belongs to.
+            video (:class:`~plexapi.video.Video`): Video this media belongs to (None once
+                the video is freed).
             aspectRatio (float): Aspect ratio of the video (ex: 2.35).
             audioChannels (int): Number of audio channels for this video (ex: 6).
             audioCodec (str): Audio codec used within the video (ex: ac3).
@@ -34,39 +42,48 @@ class Media(object):
             parts (list<:class:`~plexapi.media.MediaPart`>): List of MediaParts in this video.
     """
     TYPE = 'Media'
+    __slots__ = ('server', 'initpath', '_video', '__weakref__')
+    aspectRatio = Attr(float)
+    audioChannels = Attr(int)
+    audioCodec = Attr(intern=True)
+    bitrate = Attr(int)
+    container = Attr(intern=True)
+    duration = Attr(int)
+    height = Attr(int)
+    id = Attr(int)
+    has64bitOffsets = Attr(bool)
+    optimizedForStreaming = Attr(bool)
+    videoCodec = Attr(intern=True)
+    videoFrameRate = Attr(intern=True)
+    videoResolution = Attr(intern=True)
+    width = Attr(int)
+    parts = Elems(build=lambda *args: MediaPart(*args), tag='Part', parent=True)
 
     def __init__(self, server, data, initpath, video):
         self.server = server
         self.initpath = initpath
-        self.video = video
-        self.aspectRatio = cast(float, data.attrib.get('aspectRatio'))
-        self.audioChannels = cast(int, data.attrib.get('audioChannels'))
-        self.audioCodec = data.attrib.get('audioCodec')
-        self.bitrate = cast(int, data.attrib.get('bitrate'))
-        self.container = data.attrib.get('container')
-        self.duration = cast(int, data.attrib.get('duration'))
-        self.height = cast(int, data.attrib.get('height'))
-        self.id = cast(int, data.attrib.get('id'))
-        self.has64bitOffsets = cast(bool, data.attrib.get('has64bitOffsets'))
-        self.optimizedForStreaming = cast(bool, data.attrib.get('optimizedForStreaming'))
-        self.videoCodec = data.attrib.get('videoCodec')
-        self.videoFrameRate = data.attrib.get('videoFrameRate')
-        self.videoResolution = data.attrib.get('videoResolution')
-        self.width = cast(int, data.attrib.get('width'))
-        self.parts = [MediaPart(server, e, initpath, self) for e in data]
+        self._video = _parentRef(video)
+        self._loadData(data)
 
     def __repr__(self):
+        if self.video is None:
+            return '<%s:%s>' % (self.__class__.__name__, self.id)
         title = self.video.title.replace(' ','.')[0:20]
         return '<%s:%s>' % (self.__class__.__name__, title.encode('utf8'))
 
+    @property
+    def video(self):
+        return self._video()
 
-class MediaPart(object):
+
+class MediaPart(PlexObject):
     """ Represents a single media part (often a single file) for the media this belongs to.
         
         Attributes:
             server (:class:`~plexapi.server.PlexServer`): PlexServer object this is from.
             initpath (str): Relative path requested when retrieving specified data.
-            media (:class:`~plexapi.media.Media`): Media object this part belongs to.
+            media (:class:`~plexapi.media.Media`): Media object this part belongs to (None
+                once the media is freed).
             container (str): Container type of this media part (ex: avi).
             duration (int): Length of this media part in milliseconds.
             file (str): Path to this file on disk (ex: /media/Movies/Cars.(2006)/Cars.cd2.avi)
@@ -76,22 +93,28 @@ class MediaPart(object):
             streams (list<:class:`~plexapi.media.MediaPartStream`>): List of streams in this media part.
     """
     TYPE = 'Part'
+    __slots__ = ('server', 'initpath', '_media', '__weakref__')
+    container = Attr(intern=True)
+    duration = Attr(int)
+    file = Attr()
+    id = Attr(int)
+    key = Attr()
+    size = Attr(int)
+    streams = Elems(build=lambda *args: MediaPartStream.parse(*args), tag='Stream', parent=True)
 
     def __init__(self, server, data, initpath, media):
         self.server = server
         self.initpath = initpath
-        self.media = media
-        self.container = data.attrib.get('container')
-        self.duration = cast(int, data.attrib.get('duration'))
-        self.file = data.attrib.get('file')
-        self.id = cast(int, data.attrib.get('id'))
-        self.key = data.attrib.get('key')
-        self.size = cast(int, data.attrib.get('size'))
-        self.streams = [MediaPartStream.parse(self.server, e, self.initpath, self) for e in data if e.tag == 'Stream']
+        self._media = _parentRef(media)
+        self._loadData(data)
 
     def __repr__(self):
         return '<%s:%s>' % (self.__class__.__name__, self.id)
 
+    @property
+    def media(self):
+        return self._media()
+
     def selectedStream(self, stream_type):
         """ Return the selected stream for the specified stream_type.
             
@@ -107,13 +130,14 @@ class MediaPart(object):
         return selected[0]
 
 
-class MediaPartStream(object):
+class MediaPartStream(PlexObject):
     """ Base class for media streams. These consist of video, audio and subtitles.
         
         Attributes:
             server (:class:`~plexapi.server.PlexServer`): PlexServer object this is from.
             initpath (str): Relative path requested when retrieving specified data.
-            part (:class:`~plexapi.media.MediaPart`): Media part this stream belongs to.
+            part (:class:`~plexapi.media.MediaPart`): Media part this stream belongs to
+                (None once the part is freed).
             codec (str): Codec of this stream (ex: srt, ac3, mpeg4).
             codecID (str): Codec ID (ex: XVID).
             id (int): Unique stream ID on this server.
@@ -127,20 +151,22 @@ class MediaPartStream(object):
     """
     TYPE = None
     STREAMTYPE = None
+    __slots__ = ('server', 'initpath', '_part')
+    codec = Attr(intern=True)
+    codecID = Attr(intern=True)
+    id = Attr(int)
+    index = Attr(int, -1)
+    language = Attr(intern=True)
+    languageCode = Attr(intern=True)
+    selected = Attr(bool, False)
+    streamType = Attr(int)
+    type = Attr(int, attr='streamType')
 
     def __init__(self, server, data, initpath, part):
         self.server = server
         self.initpath = initpath
-        self.part = part
-        self.codec = data.attrib.get('codec')
-        self.codecID = data.attrib.get('codecID')
-        self.id = cast(int, data.attrib.get('id'))
-        self.index = cast(int, data.attrib.get('index', '-1'))
-        self.language = data.attrib.get('language')
-        self.languageCode = data.attrib.get('languageCode')
-        self.selected = cast(bool, data.attrib.get('selected', '0'))
-        self.streamType = cast(int, data.attrib.get('streamType'))
-        self.type = cast(int, data.attrib.get('streamType'))
+        self._part = _parentRef(part)
+        self._loadData(data)
 
     @staticmethod
     def parse(server, data, initpath, part):
@@ -153,6 +179,10 @@ class MediaPartStream(object):
     def __repr__(self):
         return '<%s:%s>' % (self.__class__.__name__, self.id)
 
+    @property
+    def part(self):
+        return self._part()
+
 
 class VideoStream(MediaPartStream):
     """ Respresents a video stream within a :class:`~plexapi.media.MediaPart`.
@@ -177,25 +207,23 @@ class VideoStream(MediaPartStream):
     """
     TYPE = 'videostream'
     STREAMTYPE = 1
-
-    def __init__(self, server, data, initpath, part):
-        super(VideoStream, self).__init__(server, data, initpath, part)
-        self.bitDepth = cast(int, data.attrib.get('bitDepth'))
-        self.bitrate = cast(int, data.attrib.get('bitrate'))
-        self.cabac = cast(int, data.attrib.get('cabac'))
-        self.chromaSubsampling = data.attrib.get('chromaSubsampling')
-        self.colorSpace = data.attrib.get('colorSpace')
-        self.duration = cast(int, data.attrib.get('duration'))
-        self.frameRate = cast(float, data.attrib.get('frameRate'))
-        self.frameRateMode = data.attrib.get('frameRateMode')
-        self.hasScallingMatrix = cast(bool, data.attrib.get('hasScallingMatrix'))
-        self.height = cast(int, data.attrib.get('height'))
-        self.level = cast(int, data.attrib.get('level'))
-        self.profile = data.attrib.get('profile')
-        self.refFrames = cast(int, data.attrib.get('refFrames'))
-        self.scanType = data.attrib.get('scanType')
-        self.title = data.attrib.get('title')
-        self.width = cast(int, data.attrib.get('width'))
+    __slots__ = ()
+    bitDepth = Attr(int)
+    bitrate = Attr(int)
+    cabac = Attr(int)
+    chromaSubsampling = Attr(intern=True)
+    colorSpace = Attr(intern=True)
+    duration = Attr(int)
+    frameRate = Attr(float)
+    frameRateMode = Attr(intern=True)
+    hasScallingMatrix = Attr(bool)
+    height = Attr(int)
+    level = Attr(int)
+    profile = Attr(intern=True)
+    refFrames = Attr(int)
+    scanType = Attr(intern=True)
+    title = Attr()
+    width = Attr(int)
 
 
 class AudioStream(MediaPartStream):
@@ -214,18 +242,16 @@ class AudioStream(MediaPartStream):
     """
     TYPE = 'audiostream'
     STREAMTYPE = 2
-
-    def __init__(self, server, data, initpath, part):
-        super(AudioStream, self).__init__(server, data, initpath, part)
-        self.audioChannelLayout = data.attrib.get('audioChannelLayout')
-        self.bitDepth = cast(int, data.attrib.get('bitDepth'))
-        self.bitrate = cast(int, data.attrib.get('bitrate'))
-        self.bitrateMode = data.attrib.get('bitrateMode')
-        self.channels = cast(int, data.attrib.get('channels'))
-        self.dialogNorm = cast(int, data.attrib.get('dialogNorm'))
-        self.duration = cast(int, data.attrib.get('duration'))
-        self.samplingRate = cast(int, data.attrib.get('samplingRate'))
-        self.title = data.attrib.get('title')
+    __slots__ = ()
+    audioChannelLayout = Attr(intern=True)
+    bitDepth = Attr(int)
+    bitrate = Attr(int)
+    bitrateMode = Attr(intern=True)
+    channels = Attr(int)
+    dialogNorm = Attr(int)
+    duration = Attr(int)
+    samplingRate = Attr(int)
+    title = Attr()
 
 
 class SubtitleStream(MediaPartStream):
@@ -238,41 +264,40 @@ class SubtitleStream(MediaPartStream):
     """
     TYPE = 'subtitlestream'
     STREAMTYPE = 3
-
-    def __init__(self, server, data, initpath, part):
-        super(SubtitleStream, self).__init__(server, data, initpath, part)
-        self.format = data.attrib.get('format')
-        self.key = data.attrib.get('key')
-        self.title = data.attrib.get('title')
+    __slots__ = ()
+    format = Attr(intern=True)
+    key = Attr()
+    title = Attr()
 
 
-class TranscodeSession(object):
+class TranscodeSession(PlexObject):
     """ Represents a current transcode session. 
         TODO: Document this.
     """
     TYPE = 'TranscodeSession'
+    audioChannels = Attr(int)
+    audioCodec = Attr(intern=True)
+    audioDecision = Attr(intern=True)
+    container = Attr(intern=True)
+    context = Attr(intern=True)
+    duration = Attr(int)
+    height = Attr(int)
+    key = Attr()
+    progress = Attr(float)
+    protocol = Attr(intern=True)
+    remaining = Attr(int)
+    speed = Attr(int)
+    throttled = Attr(int)
+    videoCodec = Attr(intern=True)
+    videoDecision = Attr(intern=True)
+    width = Attr(int)
 
     def __init__(self, server, data):
         self.server = server
-        self.audioChannels = cast(int, data.attrib.get('audioChannels'))
-        self.audioCodec = data.attrib.get('audioCodec')
-        self.audioDecision = data.attrib.get('audioDecision')
-        self.container = data.attrib.get('container')
-        self.context = data.attrib.get('context')
-        self.duration = cast(int, data.attrib.get('duration'))
-        self.height = cast(int, data.attrib.get('height'))
-        self.key = data.attrib.get('key')
-        self.progress = cast(float, data.attrib.get('progress'))
-        self.protocol = data.attrib.get('protocol')
-        self.remaining = cast(int, data.attrib.get('remaining'))
-        self.speed = cast(int, data.attrib.get('speed'))
-        self.throttled = cast(int, data.attrib.get('throttled'))
-        self.videoCodec = data.attrib.get('videoCodec')
-        self.videoDecision = data.attrib.get('videoDecision')
-        self.width = cast(int, data.attrib.get('width'))
-
-
-class MediaTag(object):
+        self._loadData(data)
+
+
+class MediaTag(PlexObject):
     """ Base class for media tags used for filtering and searching your library
         items or navigating the metadata of media items in your library. Tags are
         the construct used for things such as Country, Director, Genre, etc.
@@ -299,20 +324,22 @@ class MediaTag(object):
                 * thumb (str): URL to thumbnail image.
     """
     TYPE = None
+    __slots__ = ('_data', 'server')
+    id = Attr(int)
+    role = Attr()
+    tag = Attr(intern=True)
+    # additional attributes only from hub search
+    key = Attr()
+    librarySectionID = Attr(int)
+    librarySectionTitle = Attr(intern=True)
+    librarySectionType = Attr(intern=True)
+    tagType = Attr(int)
+    thumb = Attr()
 
     def __init__(self, server, data):
-        self._data = data
+        self._data = data if getattr(server, 'keepXML', True) else None
         self.server = server
-        self.id = cast(int, data.attrib.get('id'))
-        self.role = data.attrib.get('role')
-        self.tag = data.attrib.get('tag')
-        # additional attributes only from hub search
-        self.key = data.attrib.get('key')
-        self.librarySectionID = cast(int, data.attrib.get('librarySectionID'))
-        self.librarySectionTitle = data.attrib.get('librarySectionTitle')
-        self.librarySectionType = data.attrib.get('librarySectionType')
-        self.tagType = cast(int, data.attrib.get('tagType'))
-        self.thumb = data.attrib.get('thumb')
+        self._loadData(data)
 
     def __repr__(self):
         tag = self.tag.replace(' ', '.')[0:20].encode('utf-8')
@@ -332,54 +359,64 @@ class MediaTag(object):
 class Collection(MediaTag):
     TYPE = 'Collection'
     FILTER = 'collection'
+    __slots__ = ()
 
 
 class Country(MediaTag):
     TYPE = 'Country'
     FILTER = 'country'
+    __slots__ = ()
 
 
 class Director(MediaTag):
     TYPE = 'Director'
     FILTER = 'director'
+    __slots__ = ()
 
 
 class Genre(MediaTag):
     TYPE = 'Genre'
     FILTER = 'genre'
+    __slots__ = ()
 
 
 class Mood(MediaTag):
     TYPE = 'Mood'
     FILTER = 'mood'
+    __slots__ = ()
 
 
 class Producer(MediaTag):
     TYPE = 'Producer'
     FILTER = 'producer'
+    __slots__ = ()
 
 
 class Role(MediaTag):
     TYPE = 'Role'
     FILTER = 'role'
+    __slots__ = ()
 
 
 class Similar(MediaTag):
     TYPE = 'Similar'
     FILTER = 'similar'
+    __slots__ = ()
 
 
 class Writer(MediaTag):
     TYPE = 'Writer'
     FILTER = 'writer'
+    __slots__ = ()
 
 
-class Field(object):
+class Field(PlexObject):
     TYPE = 'Field'
+    name = Attr()
+    locked = Attr(bool)
 
     def __init__(self, data):
-        self.name = data.attrib.get('name')
-        self.locked = cast(bool, data.attrib.get('locked'))
+        self._loadData(data)
 
     def __repr__(self):
         name = self.name.replace(' ', '.')[0:20]
@@ -3,7 +3,6 @@ import plexapi, requests
 from plexapi import TIMEOUT, log, logfilter, utils
 from plexapi.exceptions import BadRequest, NotFound, Unauthorized
 from plexapi.client import PlexClient
-from plexapi.compat import ElementTree
 from plexapi.server import PlexServer
 from requests.status_codes import _codes as codes
 CONFIG = plexapi.CONFIG
@@ -146,7 +145,7 @@ class MyPlexAccount(object):
             if response.status_code == 401:
                 raise Unauthorized('(%s) %s' % (response.status_code, codename))
             raise BadRequest('(%s) %s' % (response.status_code, codename))
-        data = ElementTree.fromstring(response.text.encode('utf8'))
+        data = utils.parseXML(response.content)
         return MyPlexAccount(data, cls.SIGNIN, session=sess)
 
 
@@ -428,5 +427,5 @@ def _listItems(url, token, cls):
     headers['X-Plex-Token'] = token
     log.info('GET %s?X-Plex-Token=%s', url, token)
     response = requests.get(url, headers=headers, timeout=TIMEOUT)
-    data = ElementTree.fromstring(response.text.encode('utf8'))
+    data = utils.parseXML(response.content)
     return [cls(elem) for elem in data]
@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 from plexapi import media, utils
 from plexapi.utils import PlexPartialObject
-NA = utils.NA
 
 
 @utils.register_libtype
@@ -30,27 +29,24 @@ class Photoalbum(PlexPartialObject):
             updatedAt (datatime): Datetime this item was updated.
     """
     TYPE = 'photoalbum'
+    listType = 'photo'
+    addedAt = utils.Attr(utils.toDatetime)
+    art = utils.Attr()
+    composite = utils.Attr()
+    guid = utils.Attr()
+    index = utils.Attr(int)
+    key = utils.Attr()
+    librarySectionID = utils.Attr(intern=True)
+    ratingKey = utils.Attr()
+    summary = utils.Attr()
+    thumb = utils.Attr()
+    title = utils.Attr()
+    type = utils.Attr(intern=True)
+    updatedAt = utils.Attr(utils.toDatetime)
 
     def __init__(self, server, data, initpath):
         super(Photoalbum, self).__init__(data, initpath, server)
 
-    def _loadData(self, data):
-        """ Load attribute values from Plex XML response. """
-        self.listType = 'photo'
-        self.addedAt = utils.toDatetime(data.attrib.get('addedAt', NA))
-        self.art = data.attrib.get('art', NA)
-        self.composite = data.attrib.get('composite', NA)
-        self.guid = data.attrib.get('guid', NA)
-        self.index = utils.cast(int, data.attrib.get('index', NA))
-        self.key = data.attrib.get('key', NA)
-        self.librarySectionID = data.attrib.get('librarySectionID', NA)
-        self.ratingKey = data.attrib.get('ratingKey', NA)
-        self.summary = data.attrib.get('summary', NA)
-        self.thumb = data.attrib.get('thumb', NA)
-        self.title = data.attrib.get('title', NA)
-        self.type = data.attrib.get('type', NA)
-        self.updatedAt = utils.toDatetime(data.attrib.get('updatedAt', NA))
-
     def photos(self):
         """ Returns a list of :class:`~plexapi.photo.Photo` objects in this album. """
         path = '/library/metadata/%s/children' % self.ratingKey
@@ -93,34 +89,28 @@ class Photo(PlexPartialObject):
             year (int): Year this photo was taken.
     """
     TYPE = 'photo'
+    listType = 'photo'
+    addedAt = utils.Attr(utils.toDatetime)
+    index = utils.Attr(int)
+    key = utils.Attr()
+    originallyAvailableAt = utils.Attr(utils.toDatetime, format='%Y-%m-%d')
+    parentKey = utils.Attr(intern=True)
+    parentRatingKey = utils.Attr(intern=True)
+    ratingKey = utils.Attr()
+    summary = utils.Attr()
+    thumb = utils.Attr()
+    title = utils.Attr()
+    type = utils.Attr(intern=True)
+    updatedAt = utils.Attr(utils.toDatetime)
+    year = utils.Attr(int)
+    media = utils.Elems(media.Media, parent=True, full=True)
 
     def __init__(self, server, data, initpath):
         super(Photo, self).__init__(data, initpath, server)
 
-    def _loadData(self, data):
-        """ Load attribute values from Plex XML response. """
-        self.listType = 'photo'
-        self.addedAt = utils.toDatetime(data.attrib.get('addedAt', NA))
-        self.index = utils.cast(int, data.attrib.get('index', NA))
-        self.key = data.attrib.get('key', NA)
-        self.originallyAvailableAt = utils.toDatetime(
-            data.attrib.get('originallyAvailableAt', NA), '%Y-%m-%d')
-        self.parentKey = data.attrib.get('parentKey', NA)
-        self.parentRatingKey = data.attrib.get('parentRatingKey', NA)
-        self.ratingKey = data.attrib.get('ratingKey', NA)
-        self.summary = data.attrib.get('summary', NA)
-        self.thumb = data.attrib.get('thumb', NA)
-        self.title = data.attrib.get('title', NA)
-        self.type = data.attrib.get('type', NA)
-        self.updatedAt = utils.toDatetime(data.attrib.get('updatedAt', NA))
-        self.year = utils.cast(int, data.attrib.get('year', NA))
-        if self.isFullObject():
-            self.media = [media.Media(self.server, e, self.initpath, self)
-                for e in data if e.tag == media.Media.TYPE]
-
     def photoalbum(self):
         """ Return this photo's :class:`~plexapi.photo.Photoalbum`. """
-        return utils.listItems(self.server, self.parentKey)[0]
+        return self.server.fetchItem(self.parentKey)
 
     def section(self):
         """ Returns the :class:`~plexapi.library.LibrarySection` this item belongs to. """
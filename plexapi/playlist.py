@@ -1,14 +1,27 @@
 # -*- coding: utf-8 -*-
 from plexapi import utils
 from plexapi.exceptions import BadRequest
-from plexapi.utils import cast, toDatetime
+from plexapi.utils import toDatetime
 from plexapi.utils import PlexPartialObject, Playable
-NA = utils.NA
 
 
 @utils.register_libtype
 class Playlist(PlexPartialObject, Playable):
     TYPE = 'playlist'
+    addedAt = utils.Attr(toDatetime)
+    composite = utils.Attr()  # url to thumbnail
+    duration = utils.Attr(int)
+    durationInSeconds = utils.Attr(int)
+    guid = utils.Attr()
+    key = utils.Attr(lambda key: key.replace('/items', ''))  # FIX_BUG_50
+    leafCount = utils.Attr(int)
+    playlistType = utils.Attr()
+    ratingKey = utils.Attr(int)
+    smart = utils.Attr(bool)
+    summary = utils.Attr()
+    title = utils.Attr()
+    type = utils.Attr()
+    updatedAt = utils.Attr(toDatetime)
 
     def __init__(self, server, data, initpath):
         """Playlist stuff.
@@ -21,29 +34,6 @@ class Playlist(PlexPartialObject, Playable):
         """
         super(Playlist, self).__init__(data, initpath, server)
 
-    def _loadData(self, data):
-        """Used to set the attributes
-
-        Args:
-            data (Element): Usually built from server.query
-        """
-        Playable._loadData(self, data)
-        self.addedAt = toDatetime(data.attrib.get('addedAt', NA))
-        self.composite = data.attrib.get('composite', NA)  # url to thumbnail
-        self.duration = cast(int, data.attrib.get('duration', NA))
-        self.durationInSeconds = cast(int, data.attrib.get('durationInSeconds', NA))
-        self.guid = data.attrib.get('guid', NA)
-        self.key = data.attrib.get('key', NA)
-        self.key = self.key.replace('/items', '') if self.key else self.key  # FIX_BUG_50
-        self.leafCount = cast(int, data.attrib.get('leafCount', NA))
-        self.playlistType = data.attrib.get('playlistType', NA)
-        self.ratingKey = cast(int, data.attrib.get('ratingKey', NA))
-        self.smart = cast(bool, data.attrib.get('smart', NA))
-        self.summary = data.attrib.get('summary', NA)
-        self.title = data.attrib.get('title', NA)
-        self.type = data.attrib.get('type', NA)
-        self.updatedAt = toDatetime(data.attrib.get('updatedAt', NA))
-
     def items(self):
         """Return all items in the playlist."""
         path = '%s/items' % self.key
@@ -1,11 +1,14 @@
 # -*- coding: utf-8 -*-
-import requests
+import requests, time, weakref
+from threading import Lock
+from collections import Counter, OrderedDict
+from multiprocessing.pool import ThreadPool
 from requests.status_codes import _codes as codes
-from plexapi import BASE_HEADERS, CONFIG, TIMEOUT
+from plexapi import AUTORELOAD, BASE_HEADERS, BATCH_SIZE, CONFIG, KEEP_XML, LAZY_DECODE, MAX_WORKERS, TIMEOUT
 from plexapi import log, logfilter, utils
 from plexapi.client import PlexClient
-from plexapi.compat import ElementTree, urlencode
-from plexapi.exceptions import BadRequest, NotFound
+from plexapi.compat import urlencode
+from plexapi.exceptions import BadRequest, NotFound, UnknownType
 from plexapi.library import Library
 from plexapi.playlist import Playlist
 from plexapi.playqueue import PlayQueue
@@ -26,6 +29,21 @@ class PlexServer(object):
             token (str): Required Plex authentication token to access the server.
             session (requests.Session, optional): Use your own session object if you want to
                 cache the http responses from PMS
+            cache (:class:`~plexapi.utils.ResponseCache`, optional): Cache parsed responses of
+                repeated GET requests in memory.
+            autoreload (str, optional): When partial objects reload themselves on access to a
+                missing attribute: 'never', 'missing' (only attributes the listing they come
+                from omits; attributes it carries on other items are taken as really missing)
+                or 'eager' (any missing attribute). Defaults to the `plexapi.autoreload`
+                setting ('eager').
+            identitymap (bool, optional): Set True to keep one shared object per ratingKey in
+                memory (see `identityMap`).
+            lazy (bool, optional): Set True to decode the attributes of media objects on first
+                access instead of when they are built. Defaults to the `plexapi.lazy_decode`
+                setting (false).
+            keepxml (bool, optional): Set False to not keep the XML element of each media tag
+                (Genre, Director, etc) after it is built. Defaults to the `plexapi.keep_xml`
+                setting (true).
 
         Attributes:
             allowCameraUpload (bool): True if server allows camera upload.
@@ -33,8 +51,10 @@ class PlexServer(object):
             allowMediaDeletion (bool): True is server allows media to be deleted.
             allowSharing (bool): True is server allows sharing.
             allowSync (bool): True is server allows sync.
+            autoreload (str): Auto reload policy for partial objects (never, missing, eager).
             backgroundProcessing (bool): Unknown
             baseurl (str): Base url for the Plex Media Server to access.
+            cache (:class:`~plexapi.utils.ResponseCache`): Response cache (None if disabled).
             certificate (bool): True if server has an HTTPS certificate.
             companionProxy (bool): Unknown
             diagnostics (bool): Unknown
@@ -43,6 +63,12 @@ class PlexServer(object):
             hubSearch (bool): True if `Hub Search <https://www.plex.tv/blog
                 /seek-plex-shall-find-leveling-web-app/>`_ is enabled. I believe this
                 is enabled for everyone
+            identityMap (WeakValueDictionary): {ratingKey: object} of media objects in memory
+                (None if disabled). Listings and lookups return the existing object for a
+                ratingKey instead of a new one; full data already loaded is kept over partial
+                listings and :func:`~plexapi.server.PlexServer.fetchItem` answers from it.
+            keepXML (bool): True if media tags keep the XML element they were built from.
+            lazy (bool): True if media objects decode their attributes on first access.
             machineIdentifier (str): Unique ID for this server (looks like an md5).
             multiuser (bool): True if `multiusers <https://support.plex.tv/hc/en-us/articles
                 /200250367-Multi-User-Support>`_ are enabled.
@@ -58,10 +84,12 @@ class PlexServer(object):
                 trailers, webhooks (and maybe more).
             photoAutoTag (bool): True if photo `auto-tagging <https://support.plex.tv/hc/en-us
                 /articles/234976627-Auto-Tagging-of-Photos>`_ is enabled.
+            pager (:class:`~plexapi.utils.Pager`): Picks the page sizes used by paged listings.
             platform (str): Platform the server is hosted on (ex: Linux)
             platformVersion (str): Platform version (ex: '6.1 (Build 7601)', '4.4.0-59-generic').
             pluginHost (bool): Unknown
             readOnlyLibraries (bool): Unknown
+            reloads (Counter): Number of auto reloads by (class name, attribute name).
             requestParametersInCookie (bool): Unknown
             session (Session): Requests session used for object caching.
             streamingBrainVersion (bool): Current `Streaming Brain <https://www.plex.tv/blog
@@ -83,13 +111,25 @@ class PlexServer(object):
             version (str): Current Plex version (ex: 1.3.2.3112-1751929)
             voiceSearch (bool): True if voice search is enabled. (is this Google Voice search?)
     """
-    def __init__(self, baseurl='http://localhost:32400', token=None, session=None):
+    def __init__(self, baseurl='http://localhost:32400', token=None, session=None, cache=None,
+                 autoreload=None, identitymap=False, lazy=None, keepxml=None):
         self.baseurl = baseurl or CONFIG.get('authentication.baseurl')
         self.token = token or CONFIG.get('authentication.token')
         if self.token:
             logfilter.add_secret(self.token)
         self.session = session or requests.Session()
+        self.cache = cache
+        self.autoreload = autoreload or AUTORELOAD
+        self.reloads = Counter()
+        self._listedattrs = {}  # (class name, listing kind) -> XML attributes it carries
+        self.identityMap = weakref.WeakValueDictionary() if identitymap else None
+        self.lazy = LAZY_DECODE if lazy is None else lazy
+        self.keepXML = KEEP_XML if keepxml is None else keepxml
         self._library = None  # cached library
+        self._pool = None  # worker pool for async requests
+        self._poolLock = Lock()
+        self._inflight = utils.SingleFlight()  # coalesces identical concurrent GETs
+        self.pager = utils.Pager()  # adaptive page sizes for paged listings
         self.reload()
 
     def _loadData(self, data):
@@ -147,6 +187,34 @@ class PlexServer(object):
             self._library = Library(self, self.query('/library/'))
         return self._library
 
+    @property
+    def pool(self):
+        """ Worker pool used to run async requests against this server. The pool is created
+            on first use and never runs more than `plexapi.max_workers` requests at once.
+        """
+        if self._pool is None:
+            with self._poolLock:
+                if self._pool is None:
+                    self._pool = ThreadPool(MAX_WORKERS)
+        return self._pool
+
+    def close(self):
+        """ Stops the worker pool of this server (see `pool`) once its pending requests are
+            done. The server can still be used; a new pool is created when needed. Servers
+            can also be used as context managers, closing them on exit.
+        """
+        with self._poolLock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
     def account(self):
         """ Returns the :class:`~plexapi.server.Account` object this server belongs to. """
         data = self.query('/myplex/account')
@@ -194,6 +262,56 @@ class PlexServer(object):
         """
         return PlayQueue.create(self, item)
 
+    def fetchItem(self, key):
+        """ Returns the full media object for the specified ratingKey or /library/metadata/
+            path. With the identity map enabled, a full object already in memory is returned
+            without a request.
+
+            Parameters:
+                key (int, str): ratingKey or path of the item to fetch.
+
+            Raises:
+                :class:`~plexapi.exceptions.NotFound`: Unable to find the item.
+        """
+        path = key if str(key).startswith('/') else '/library/metadata/%s' % key
+        if self.identityMap is not None:
+            item = self.identityMap.get(path.replace('/library/metadata/', ''))
+            if item is not None and item.isFullObject():
+                return item
+        data = self.query(path)
+        if data is None or not len(data):
+            raise NotFound('Unable to find key: %s' % key)
+        return utils.buildItem(self, data[0], path)
+
+    def fetchItems(self, keys, chunk=None):
+        """ Returns a list of full media objects for the specified ratingKeys. Instead of
+            one request per item, the keys are requested in batches of `chunk` items from
+            /library/metadata/<key1>,<key2>,... Keys not found on the server are skipped.
+
+            Parameters:
+                keys (list<int>): ratingKeys of the items to fetch.
+                chunk (int): Max items per request (default `plexapi.batch_size`).
+        """
+        elems = self._fetchMetadata(keys, chunk)
+        items = []
+        for key, elem in elems.items():
+            try:
+                items.append(utils.buildItem(self, elem, '/library/metadata/%s' % key))
+            except UnknownType:
+                pass
+        return items
+
+    def _fetchMetadata(self, keys, chunk=None):
+        # Returns an OrderedDict of {ratingKey: elem} fetched in batches of chunk keys.
+        keys = list(OrderedDict((str(key), None) for key in keys))
+        chunk = chunk or BATCH_SIZE
+        paths = ['/library/metadata/%s' % ','.join(keys[i:i + chunk]) for i in range(0, len(keys), chunk)]
+        found = {}
+        for data in utils.mapThreaded(self.query, paths):
+            for elem in data if data is not None else []:
+                found[elem.attrib.get('ratingKey')] = elem
+        return OrderedDict((key, found[key]) for key in keys if key in found)
+
     def headers(self):
         """ Returns a dict containing base headers to include in all requests to the server. """
         headers = BASE_HEADERS
@@ -201,9 +319,45 @@ class PlexServer(object):
             headers['X-Plex-Token'] = self.token
         return headers
 
-    def history(self):
-        """ Returns a list of media items from watched history. """
-        return utils.listItems(self, '/status/sessions/history/all')
+    def history(self, maxresults=None, containerSize=None, fields=None, as_records=False):
+        """ Returns a list of media items from watched history.
+
+            Parameters:
+                maxresults (int): Max number of items to return, requested in batches (default
+                    the single response of the server).
+                containerSize (int): Fixed number of results to request per batch (optional).
+                fields (list<str>): Return records of only these attributes instead of objects
+                    (see :func:`~plexapi.utils.buildRecord()`; optional).
+                as_records (bool): Return records of all attributes instead of objects.
+        """
+        path = '/status/sessions/history/all'
+        if maxresults is None:
+            return utils.listItems(self, path, fields=fields, as_records=as_records)
+        return utils.listPagedItems(self, path, maxresults, containerSize, fields, as_records)
+
+    def iterparse(self, path, headers=None, **kwargs):
+        """ Streams the GET response for path and incrementally parses it, yielding
+            ('start', element) and ('end', element) pairs as soon as each tag has been
+            downloaded. Closing the generator stops downloading the rest of the response.
+            See :func:`~plexapi.utils.iterItems()` for building objects from the stream.
+
+            Parameters:
+                path (str): Relative path to query on the server api.
+                headers (dict): Optionally include additional headers for this request.
+                **kwargs (dict): Optionally include additional kwargs for session.get().
+
+            Raises:
+                :class:`~plexapi.exceptions.BadRequest`: Raised when response is not in (200, 201).
+        """
+        response = self._request(path, None, headers, stream=True, **kwargs)
+        try:
+            if response.headers.get('content-length') == '0':
+                return
+            response.raw.decode_content = True
+            for event, elem in utils.iterparseXML(response.raw):
+                yield event, elem
+        finally:
+            response.close()
 
     def playlists(self):
         """ Returns a list of all :class:`~plexapi.playlist.Playlist` objects saved on the server. """
@@ -227,8 +381,13 @@ class PlexServer(object):
 
     def query(self, path, method=None, headers=None, **kwargs):
         """ Main method used to handle HTTPS requests to the Plex server. This method helps
-            by encoding the response to utf-8 and parsing the returned XML into and
-            ElementTree object. Returns None if no data exists in the response.
+            by parsing the returned XML bytes into and ElementTree object with the parser
+            backend set in `plexapi.xml_parser`. Returns None if no data exists in the response.
+            If this server has a :class:`~plexapi.utils.ResponseCache`, cacheable GET requests
+            are answered from it. Identical read-only GET requests made at the same time from
+            several threads share a single HTTP request and parsed response; requests that
+            change state (actions such as /refresh or /:/scrobble, and /player/ commands)
+            are always sent.
 
             Parameters:
                 path (str): Relative path to query on the server api (ex: '/search?query=HELLO')
@@ -241,6 +400,50 @@ class PlexServer(object):
             Raises:
                 :class:`~plexapi.exceptions.BadRequest`: Raised when response is not in (200, 201).
         """
+        if (method is None or method == self.session.get) and not kwargs and self._isRead(path):
+            key = (path, tuple(sorted((headers or {}).items())))
+            return self._inflight.do(key, self._query, path, method, headers)
+        return self._query(path, method, headers, **kwargs)
+
+    def _isRead(self, path):
+        # True if a GET of path only reads state, so identical requests may share a response.
+        path = path.split('?')[0]
+        return not path.startswith('/player/') and not utils.ResponseCache.ACTIONS.search(path)
+
+    def _query(self, path, method=None, headers=None, **kwargs):
+        if self.cache is not None:
+            return self._cachedQuery(path, method, headers, **kwargs)
+        response = self._request(path, method, headers, **kwargs)
+        return utils.parseXML(response.content)
+
+    def _cachedQuery(self, path, method=None, headers=None, **kwargs):
+        # Same as query() but answers from, revalidates and fills self.cache.
+        cache = self.cache
+        if cache.isAction((method or self.session.get).__name__.upper(), path):
+            cache.invalidate()
+            return utils.parseXML(self._request(path, method, headers, **kwargs).content)
+        ttl = cache.ttl(path) if not kwargs else 0
+        if not ttl:
+            cache.miss()
+            return utils.parseXML(self._request(path, method, headers, **kwargs).content)
+        # Responses depend on the token and client identity as well as the path.
+        keyheaders = dict(self.headers(), **(headers or {}))
+        entry = cache.get(path, keyheaders)
+        if entry and entry[1] > time.time():
+            return utils.parseXML(entry[0])
+        headers = dict(entry[2], **(headers or {})) if entry else headers
+        response = self._request(path, method, headers, ok=(200, 201, 304))
+        content = entry[0] if response.status_code == 304 else response.content
+        validators = {}
+        if response.headers.get('etag'):
+            validators['If-None-Match'] = response.headers['etag']
+        if response.headers.get('last-modified'):
+            validators['If-Modified-Since'] = response.headers['last-modified']
+        cache.set(path, content, ttl, validators, keyheaders)
+        return utils.parseXML(content)
+
+    def _request(self, path, method=None, headers=None, ok=(200, 201), **kwargs):
+        # Sends the request and returns the response; raises BadRequest unless the status is ok.
         url = self.url(path)
         method = method or self.session.get
         log.info('%s %s', method.__name__.upper(), url)
@@ -248,12 +451,43 @@ class PlexServer(object):
         if headers:
             h.update(headers)
         response = method(url, headers=h, timeout=TIMEOUT, **kwargs)
-        #print(response.url)
-        if response.status_code not in [200, 201]:  # pragma: no cover
+        if response.status_code not in ok:  # pragma: no cover
             codename = codes.get(response.status_code)[0]
             raise BadRequest('(%s) %s %s' % (response.status_code, codename, response.url))
-        data = response.text.encode('utf8')
-        return ElementTree.fromstring(data) if data else None
+        return response
+
+    def queryPage(self, path, start, size):
+        """ Returns an ElementTree of one page of the container at path: at most size children
+            starting at offset start. The time and bytes it took are reported to this server's
+            :class:`~plexapi.utils.Pager` so it can adapt the size of following pages.
+
+            Parameters:
+                path (str): Relative path to query on the server api.
+                start (int): Offset of the first child to return (X-Plex-Container-Start).
+                size (int): Number of children to return (X-Plex-Container-Size).
+        """
+        delim = '&' if '?' in path else '?'
+        path = '%s%sX-Plex-Container-Start=%s&X-Plex-Container-Size=%s' % (path, delim, start, size)
+        started = time.time()
+        response = self._request(path)
+        content = response.content
+        self.pager.update(size, time.time() - started, len(content))
+        return utils.parseXML(content)
+
+    def queryAsync(self, path, method=None, headers=None, **kwargs):
+        """ Same as :func:`~plexapi.server.PlexServer.query()` but returns immediately with an
+            :class:`~multiprocessing.pool.AsyncResult`. Call `get()` on the result to wait
+            for the parsed ElementTree. Many async queries can be issued at once; they share
+            this server's bounded worker :attr:`~plexapi.server.PlexServer.pool`.
+
+            Parameters:
+                path (str): Relative path to query on the server api (ex: '/search?query=HELLO')
+                method (func): requests.method to use for this query (defaults to get).
+                headers (dict): Optionally include additional headers for this request.
+                **kwargs (dict): Optionally include additional kwargs for in the specified
+                    reuqest method. These kwargs are simply passed through to method().
+        """
+        return self.pool.apply_async(self.query, (path, method, headers), kwargs)
 
     def reload(self):
         """ Reload attribute values from Plex XML response.  """
@@ -264,6 +498,23 @@ class PlexServer(object):
             log.error('%s: %s', self.baseurl, err)
             raise NotFound('No server found at: %s' % self.baseurl)
 
+    def reloadAll(self, items, chunk=None):
+        """ Reloads the specified partial objects in place from batched metadata requests
+            (see :func:`~plexapi.server.PlexServer.fetchItems`) and returns them.
+
+            Parameters:
+                items (list): Media objects to reload.
+                chunk (int): Max items per request (default `plexapi.batch_size`).
+        """
+        elems = self._fetchMetadata([item.ratingKey for item in items], chunk)
+        for item in items:
+            elem = elems.get(str(item.ratingKey))
+            if elem is not None:
+                item.initpath = item.key
+                item._loadData(elem)
+                item._reloaded = True
+        return items
+
     def search(self, query, mediatype=None, limit=None):
         """ Returns a list of media items or filter categories from the resulting
             `Hub Search <https://www.plex.tv/blog/seek-plex-shall-find-leveling-web-app/>`_
@@ -292,9 +543,15 @@ class PlexServer(object):
             results += hub.items
         return results
 
-    def sessions(self):
-        """ Returns a list of all active session (currently playing) media objects. """
-        return utils.listItems(self, '/status/sessions')
+    def sessions(self, fields=None, as_records=False):
+        """ Returns a list of all active session (currently playing) media objects.
+
+            Parameters:
+                fields (list<str>): Return records of only these attributes instead of objects
+                    (see :func:`~plexapi.utils.buildRecord()`; optional).
+                as_records (bool): Return records of all attributes instead of objects.
+        """
+        return utils.listItems(self, '/status/sessions', fields=fields, as_records=as_records)
 
     def url(self, path):
         """ Utility function to help build proper URL strings as well as always include
@@ -1,9 +1,16 @@
 # -*- coding: utf-8 -*-
-import logging, os, re, requests
+import logging, os, re, requests, time, weakref
+from array import array
+from collections import OrderedDict, deque, namedtuple
 from datetime import datetime
-from threading import Thread
-from plexapi.compat import quote, string_type, urlencode
-from plexapi.exceptions import NotFound, NotImplementedError, UnknownType, Unsupported
+from fnmatch import fnmatch
+from io import BytesIO
+from multiprocessing.pool import ThreadPool
+from threading import Event, Lock, Thread
+from types import MemberDescriptorType
+from plexapi.compat import ElementTree, intern, lxml, numpy, quote, string_type, urlencode, with_metaclass
+from plexapi.exceptions import BadRequest, NotFound, UnknownType, Unsupported
+log = logging.getLogger('plexapi')
 
 # Search Types - Plex uses these to filter specific media types when searching.
 SEARCHTYPES = {'movie': 1, 'show': 2, 'season': 3, 'episode': 4,
@@ -31,7 +38,7 @@ class _NA(object):
         return False
 
     def __eq__(self, other):
-        return isinstance(other, _NA) or other in [None, '__NA__']
+        return other is None or isinstance(other, _NA) or other == '__NA__'
 
     def __nonzero__(self):
         return False
@@ -60,17 +67,434 @@ class SecretsFilter(logging.Filter):
         return True
 
 
-class PlexPartialObject(object):
+class Pager(object):
+    """ Picks the X-Plex-Container-Size used when paging through large listings. Each page
+        fetched reports its size, latency and bytes, and the next page size is scaled toward
+        what the server can return in the target latency without going over the target bytes.
+        The size never changes by more than 2x per page and always stays within the bounds.
+        Set minsize equal to maxsize to disable adapting.
+
+        Parameters:
+            size (int): Initial page size (default `plexapi.container_size`).
+            minsize (int): Smallest page size (default `plexapi.container_size_min`).
+            maxsize (int): Largest page size (default `plexapi.container_size_max`).
+            latency (float): Target seconds per page (default `plexapi.container_latency`).
+            maxbytes (int): Target max bytes per page (default `plexapi.container_bytes`).
+
+        Attributes:
+            size (int): Page size to use for the next page.
+            samples (deque): Recent (size, seconds, bytes, nextsize) tuples of pages fetched.
+    """
+    def __init__(self, size=None, minsize=None, maxsize=None, latency=None, maxbytes=None):
+        import plexapi
+        self.minsize = minsize or plexapi.X_PLEX_CONTAINER_MIN
+        self.maxsize = maxsize or plexapi.X_PLEX_CONTAINER_MAX
+        self.latency = latency or plexapi.X_PLEX_CONTAINER_LATENCY
+        self.maxbytes = maxbytes or plexapi.X_PLEX_CONTAINER_BYTES
+        self.size = self._bound(size or plexapi.X_PLEX_CONTAINER_SIZE)
+        self.samples = deque(maxlen=100)
+
+    def _bound(self, size):
+        return int(max(self.minsize, min(self.maxsize, size)))
+
+    def update(self, size, seconds, nbytes):
+        """ Records a fetched page and returns the page size to use next.
+
+            Parameters:
+                size (int): Page size that was requested.
+                seconds (float): Time taken to download the page.
+                nbytes (int): Size of the response body in bytes.
+        """
+        if size > 0 and seconds > 0:
+            target = size * self.latency / seconds
+            if nbytes:
+                target = min(target, size * self.maxbytes / float(nbytes))
+            target = max(self.size / 2.0, min(self.size * 2.0, target))
+            self.size = self._bound(target)
+        self.samples.append((size, seconds, nbytes, self.size))
+        log.debug('Page of %s items took %.3fs (%s bytes); next page size %s', size, seconds, nbytes, self.size)
+        return self.size
+
+
+class SingleFlight(object):
+    """ Coalesces identical calls made at the same time from several threads. The first
+        caller of :func:`~plexapi.utils.SingleFlight.do` for a key runs the function; callers
+        arriving with the same key while it runs wait for it and get the same result (or
+        exception) instead of running the function again.
+
+        Attributes:
+            shared (int): Number of calls answered by another thread's in-flight call.
+    """
+
+    def __init__(self):
+        self.shared = 0
+        self._calls = {}  # key -> [Event, result, error]
+        self._lock = Lock()
+
+    def do(self, key, func, *args, **kwargs):
+        """ Returns func(*args, **kwargs), sharing the call with other threads using key. """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = [Event(), None, None]
+            else:
+                self.shared += 1
+        if not leader:
+            call[0].wait()
+            if call[2] is not None:
+                raise call[2]
+            return call[1]
+        try:
+            call[1] = func(*args, **kwargs)
+            return call[1]
+        except Exception as err:
+            call[2] = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call[0].set()
+
+
+class ResponseCache(object):
+    """ In-memory LRU cache of GET responses for :func:`~plexapi.server.PlexServer.query()`.
+        Pass an instance as the `cache` argument of :class:`~plexapi.server.PlexServer` to
+        enable it. Responses are kept as bytes per path and request headers (token, client
+        identity, ...) and parsed again for each caller, so callers never share a tree.
+        Each path is kept for the TTL of the longest prefix rule it starts with
+        (rules may use fnmatch wildcards); paths without a rule are never cached. Expired
+        entries that came with an ETag or Last-Modified header are revalidated with a
+        conditional request and reused if the server answers 304 Not Modified. Any request
+        that changes server state (PUT, POST, DELETE, or an action path such as /refresh or
+        /:/scrobble) clears the cache.
+
+        Parameters:
+            rules (dict): {path_prefix: ttl_seconds} (default `ResponseCache.RULES`).
+            maxsize (int): Max number of responses to keep (default 256).
+
+        Attributes:
+            hits (int): Number of queries answered from the cache.
+            misses (int): Number of queries that went to the server.
+    """
+    RULES = {'/library/sections': 60, '/library/metadata/': 30}
+    ACTIONS = re.compile(r'^/:/|/(refresh|analyze|emptyTrash|optimize|clean)\b')
+
+    def __init__(self, rules=None, maxsize=256):
+        self.rules = sorted((rules or self.RULES).items(), key=lambda r: len(r[0]), reverse=True)
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # (path, headers) -> (content, expires, validators)
+        self._lock = Lock()
+
+    @staticmethod
+    def _key(path, headers):
+        return (path, tuple(sorted((headers or {}).items())))
+
+    def __len__(self):
+        return len(self._entries)
+
+    def isAction(self, method, path):
+        """ Returns True if the request changes server state and should clear the cache. """
+        return method != 'GET' or bool(self.ACTIONS.search(path.split('?')[0]))
+
+    def ttl(self, path):
+        """ Returns the number of seconds path may be cached for (0 if never). """
+        for prefix, ttl in self.rules:
+            if fnmatch(path, prefix + '*'):
+                return ttl
+        return 0
+
+    def get(self, path, headers=None):
+        """ Returns the cached (content, expires, validators) for path requested with headers,
+            or None. Counts a hit if the entry is still fresh and a miss otherwise.
+
+            Parameters:
+                path (str): Path that is requested.
+                headers (dict): Request headers the response depends on (optional).
+        """
+        key = self._key(path, headers)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._entries[key] = entry  # move to the end (most recently used)
+            if entry is not None and entry[1] > time.time():
+                self.hits += 1
+            else:
+                self.misses += 1
+            return entry
+
+    def miss(self):
+        """ Counts a query that went to the server without looking in the cache. """
+        with self._lock:
+            self.misses += 1
+
+    def set(self, path, content, ttl, validators=None, headers=None):
+        """ Caches the response content for path for ttl seconds.
+
+            Parameters:
+                path (str): Path that was requested.
+                content (bytes): Response body.
+                ttl (int): Seconds until the entry has to be revalidated.
+                validators (dict): Conditional request headers (If-None-Match, If-Modified-Since).
+                headers (dict): Request headers the response depends on (optional).
+        """
+        key = self._key(path, headers)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (content, time.time() + ttl, validators or {})
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, prefix=''):
+        """ Removes all cached responses for paths starting with prefix (all by default).
+
+            Parameters:
+                prefix (str): Path prefix to remove (ex: '/library/sections/1').
+        """
+        with self._lock:
+            for key in [k for k in self._entries if k[0].startswith(prefix)]:
+                del self._entries[key]
+
+
+class Attr(object):
+    """ Declares an attribute of a :class:`~plexapi.utils.PlexPartialObject` read from an
+        attribute of its XML element. Declared attributes are decoded when the object is
+        loaded or, when the server decodes lazily (see `PlexServer.lazy`), from the retained
+        element the first time they are read.
+
+        Parameters:
+            cast (func): Converts the attribute string (ex: int, bool, toDatetime; optional).
+            default: Value used when the element doesn't have the attribute (default NA).
+            attr (str): Name of the XML attribute (defaults to the declared name).
+            fallback (str): XML attribute to read when `attr` is missing (optional).
+            format (str): Second argument passed to cast (ex: the toDatetime format).
+            intern (bool): Share one copy of each string among all objects. Use it for
+                attributes with few distinct values (ex: codec, contentRating, studio).
+    """
+    full = False
+
+    def __init__(self, cast=None, default=NA, attr=None, fallback=None, format=None, intern=False):
+        self.name = None
+        self.attr = attr
+        self.cast = cast
+        self.default = default
+        self.fallback = fallback
+        self.format = format
+        self.intern = intern
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return obj._decode(self)
+
+    def present(self, data):
+        """ Returns True if the element carries this attribute. """
+        return self.attr in data.attrib or (self.fallback is not None and self.fallback in data.attrib)
+
+    def decode(self, obj, data):
+        """ Returns the value of this attribute for obj decoded from the element data. """
+        value = data.attrib.get(self.attr)
+        if value is None and self.fallback is not None:
+            value = data.attrib.get(self.fallback)
+        if value is None:
+            return self.default
+        if self.cast in (int, float, bool):
+            return cast(self.cast, value)
+        if self.format is not None:
+            return self.cast(value, self.format)
+        if self.cast:
+            return self.cast(value)
+        return intern(value) if self.intern else value
+
+
+class Elems(Attr):
+    """ Declares a list attribute built from the child elements tagged `cls.TYPE`.
+
+        Parameters:
+            cls (type): Class to build for each child, called with (server, elem) or with
+                (server, elem, initpath, obj) if parent is True.
+            build (func): Called instead of cls with the same arguments (optional).
+            tag (str): Tag of the child elements (defaults to cls.TYPE).
+            parent (bool): Pass the initpath and the object itself to cls.
+            full (bool): Only build the list for full objects; partial objects reload when
+                it is read.
+    """
+
+    def __init__(self, cls=None, build=None, tag=None, parent=False, full=False):
+        super(Elems, self).__init__()
+        self.tag = tag or cls.TYPE
+        self.build = build or cls
+        self.parent = parent
+        self.full = full
+
+    def present(self, data):
+        return True
+
+    def decode(self, obj, data):
+        if self.parent:
+            return [self.build(obj.server, e, obj.initpath, obj) for e in data if e.tag == self.tag]
+        return [self.build(obj.server, e) for e in data if e.tag == self.tag]
+
+
+class Computed(Attr):
+    """ Declares an attribute computed from the XML element with func(data), or with
+        func(server, data) if server is True.
+    """
+
+    def __init__(self, func, server=False):
+        super(Computed, self).__init__()
+        self.func = func
+        self.server = server
+
+    def present(self, data):
+        return True
+
+    def decode(self, obj, data):
+        return self.func(obj.server, data) if self.server else self.func(data)
+
+
+class SchemaType(type):
+    """ Metaclass collecting the :class:`~plexapi.utils.Attr` declarations of a class and
+        its bases into the ordered dict `_fields` (key first), and compiling them into the
+        `_load(self, data)` function that loads its objects. When a class defines
+        `__slots__`, its declared attributes are added to the slots instead of the class.
+    """
+
+    def __new__(mcs, name, bases, attrs):
+        if '__slots__' in attrs:
+            slotfields = dict((attr, field) for attr, field in attrs.items() if isinstance(field, Attr))
+            for attr in slotfields:
+                del attrs[attr]
+            attrs['__slots__'] = tuple(attrs['__slots__']) + tuple(sorted(slotfields))
+            attrs['_slotfields'] = slotfields
+        return super(SchemaType, mcs).__new__(mcs, name, bases, attrs)
+
+    def __init__(cls, name, bases, attrs):
+        super(SchemaType, cls).__init__(name, bases, attrs)
+        fields = {}
+        for klass in reversed(cls.__mro__):
+            declared = dict(vars(klass), **vars(klass).get('_slotfields', {}))
+            for attr, field in declared.items():
+                if isinstance(field, Attr):
+                    field.name = attr
+                    field.attr = field.attr or attr
+                    fields[attr] = field
+        cls._fields = OrderedDict(sorted(fields.items(), key=lambda f: (f[0] != 'key', f[0])))
+        cls._load = _compileLoader(cls)
+
+
+def _compileLoader(cls):
+    # Generates one straight-line function assigning every declared attribute of cls
+    # to the instance dict (or its slot), without the generic cast() and __setattr__
+    # on the way. Partial objects keep the NA rules of PlexPartialObject.__setattr__:
+    # missing values are only stored on full objects and full-only lists only built
+    # for them.
+    partial = getattr(cls, '_partial', False)
+    env = {'NA': NA, 'nan': float('nan'), 'intern': intern}
+    lines = ['def _load(self, data):', '    get = data.attrib.get']
+    if not partial or 'key' not in cls._fields:
+        lines.append('    full = True')
+    for i, (name, field) in enumerate(cls._fields.items()):
+        slot = isinstance(getattr(cls, name), MemberDescriptorType)
+        target = 'self.%s' % name if slot else "d['%s']" % name
+        missing = 'NA' if partial else 'None'
+        _fieldLines(lines, env, i, field, target, partial and name != 'key', missing)
+        if partial and name == 'key':
+            lines.append('    full = self.isFullObject()')
+    if any("d['" in line for line in lines):
+        lines.insert(1, '    d = self.__dict__')
+    exec(compile('\n'.join(lines), '<%s loader>' % cls.__name__, 'exec'), env)
+    return env['_load']
+
+
+def _compileRecordLoader(cls, record, fields):
+    # Same as _compileLoader, but the function returns a record of the specified
+    # fields, with None for the missing ones. Fields cls doesn't declare are None.
+    env = {'NA': NA, 'nan': float('nan'), 'intern': intern, 'new': tuple.__new__, 'record': record}
+    lines = ['def _load(self, data):', '    get = data.attrib.get', '    full = True']
+    for i, name in enumerate(fields):
+        if name in cls._fields:
+            _fieldLines(lines, env, i, cls._fields[name], 'r%s' % i, False)
+        else:
+            lines.append('    r%s = None' % i)
+    lines.append('    return new(record, (%s,))' % ', '.join('r%s' % i for i in range(len(fields))))
+    exec(compile('\n'.join(lines), '<%s record loader>' % cls.__name__, 'exec'), env)
+    return env['_load']
+
+
+def _fieldLines(lines, env, i, field, target, partial, missing='None'):
+    # Appends the lines decoding field into target, or storing missing when the element
+    # doesn't have it. With partial, missing values are NA and only stored when the
+    # local `full` is set.
+    f = env['f%s' % i] = field
+    store = '        %s = %%s' % target
+    check = '        if full or (x is not None and x is not NA): %s = x' % target
+    if type(f) is not Attr:
+        if f.full:
+            lines.append('    if full: %s = f%s.decode(self, data)' % (target, i))
+        else:
+            lines.append('    x = f%s.decode(self, data)' % i)
+            lines.append(check[4:] if partial else '    %s = x' % target)
+        return
+    lines.append('    v = get(%r)' % f.attr)
+    if f.fallback is not None:
+        lines.append('    if v is None: v = get(%r)' % f.fallback)
+    lines.append('    if v is not None:')
+    if f.cast in (int, float):
+        lines += ['        try:', '    ' + store % '%s(v)' % f.cast.__name__,
+            '        except ValueError:', '    ' + store % 'nan']
+    elif f.cast is bool:
+        lines.append(store % 'bool(int(v))')
+    elif f.cast is None:
+        lines.append(store % ('intern(v)' if f.intern else 'v'))
+    else:
+        env['c%s' % i] = f.cast
+        call = 'c%s(v%s)' % (i, '' if f.format is None else ', %r' % f.format)
+        lines.append('        x = %s' % call)
+        lines.append(check if partial else store % 'x')
+    if f.default is not NA and f.default is not None:
+        lines.append('    else:')
+        lines.append(store % 'f%s.default' % i)
+    elif partial:
+        lines.append('    elif full: %s = NA' % target)
+    else:
+        lines.append('    else:')
+        lines.append(store % missing)
+
+
+class PlexObject(with_metaclass(SchemaType)):
+    """ Base class for objects built from an XML element with attributes declared with
+        :class:`~plexapi.utils.Attr`. All declared attributes are loaded when the object
+        is built; the ones missing from the element are None. Subclasses built in large
+        numbers may define `__slots__` to store them without a per-object dict.
+    """
+    __slots__ = ()
+    _partial = False
+
+    def _decode(self, field):
+        return None
+
+    def _loadData(self, data):
+        """ Loads the declared attributes from data. """
+        self._load(data)
+
+
+class PlexPartialObject(PlexObject):
     """ Not all objects in the Plex listings return the complete list of elements
         for the object. This object will allow you to assume each object is complete,
         and if the specified value you request is None it will fetch the full object
-        automatically and update itself.
+        automatically and update itself. Attributes declared with
+        :class:`~plexapi.utils.Attr` are loaded by this class (see `_loadData`).
 
         Attributes:
             data (ElementTree): Response from PlexServer used to build this object (optional).
             initpath (str): Relative path requested when retrieving specified `data` (optional).
             server (:class:`~plexapi.server.PlexServer`): PlexServer object this is from.
     """
+    _partial = True
+
     def __init__(self, data, initpath, server=None):
         self.server = server
         self.initpath = initpath
@@ -90,16 +514,71 @@ class PlexPartialObject(object):
         # Auto reload self, from the full key (path) when needed.
         if attr == 'key' or self.__dict__.get(attr) or self.isFullObject():
             return self.__dict__.get(attr, NA)
-        print('reload because of %s' % attr)
-        self.reload()
+        self._autoreload(attr)
         return self.__dict__.get(attr, NA)
 
     def __setattr__(self, attr, value):
         if value != NA or self.isFullObject():
             self.__dict__[attr] = value
 
+    def _autoreload(self, attr):
+        # Reloads this partial object because attr is missing, unless the server's
+        # autoreload policy says it isn't worth a request. Returns True if reloaded.
+        server = self.__dict__.get('server')
+        clsname = self.__class__.__name__
+        if server is not None:
+            policy = getattr(server, 'autoreload', 'eager')
+            if policy == 'never' or (policy == 'missing' and self._listedWithout(attr)):
+                return False
+            server.reloads[(clsname, attr)] += 1
+        log.debug('Reloading %s %s because of %s', clsname, self.key, attr)
+        self._reloadSiblings()
+        return True
+
+    def _listedWithout(self, attr):
+        # True if the listing this object comes from carries attr on other items of this
+        # class: the listing doesn't omit it, so this item really has no value for it.
+        listed = getattr(self.server, '_listedattrs', {}).get(
+            (self.__class__.__name__, _listingKind(self.initpath)))
+        if not listed:
+            return False
+        field = self._fields.get(attr)
+        names = (field.attr, field.fallback) if field is not None else (attr,)
+        return any(name in listed for name in names if name)
+
+    def _decode(self, field):
+        # Returns the declared attribute field not loaded yet: decoded from the retained
+        # element (lazy objects) or, for partial objects missing it, after a reload.
+        data = self.__dict__.get('_data')
+        if field.name == 'key':
+            value = field.decode(self, data) if data is not None else NA
+            self.__dict__['key'] = value
+            return value
+        partial = self.isPartialObject()
+        if data is not None and not (field.full and partial):
+            value = field.decode(self, data)
+            if not partial or (value is not None and value is not NA):
+                self.__dict__[field.name] = value
+                return value
+        if partial and self._autoreload(field.name):
+            return getattr(self, field.name)
+        return NA
+
     def _loadData(self, data):
-        raise NotImplementedError('Abstract method not implemented.')
+        """ Loads the declared attributes (:class:`~plexapi.utils.Attr`) from data. Lazy
+            objects only keep data and decode each attribute on first access. Subclasses
+            extend this to load anything else.
+        """
+        if self._lazy():
+            d = self.__dict__
+            for name in self._fields:
+                d.pop(name, None)
+            d['_data'] = data
+            return
+        self._load(data)
+
+    def _lazy(self):
+        return getattr(self.__dict__.get('server'), 'lazy', False)
 
     def isFullObject(self):
         """ Retruns True if this is already a full object. A full object means all attributes
@@ -113,6 +592,24 @@ class PlexPartialObject(object):
         """ Returns True if this is NOT a full object. """
         return not self.isFullObject()
 
+    def _reloadSiblings(self):
+        # Reload self together with the next partial items it was listed with (see
+        # buildItems) in one batched request; fall back to reloading only self.
+        import plexapi
+        group, index = self.__dict__.get('_siblings', ((), 0))
+        siblings = []
+        for ref in group[index:]:
+            item = ref()
+            if item is not None and item.server is self.server and item.isPartialObject() \
+                    and str(item.key).startswith('/library/metadata/'):
+                siblings.append(item)
+                if len(siblings) == plexapi.BATCH_SIZE:
+                    break
+        if len(siblings) > 1:
+            self.server.reloadAll(siblings)
+        if self.isPartialObject():
+            self.reload()
+
     def reload(self):
         """ Reload the data for this object from PlexServer XML. """
         data = self.server.query(self.key)
@@ -136,17 +633,16 @@ class Playable(object):
             username (str): Username of the person playing this item (for active sessions).
             viewedAt (datetime): Datetime item was last viewed (history).
     """
-
-    def _loadData(self, data):
-        # Load data for active sessions (/status/sessions)
-        self.sessionKey = cast(int, data.attrib.get('sessionKey', NA))
-        self.username = findUsername(data)
-        self.player = findPlayer(self.server, data)
-        self.transcodeSession = findTranscodeSession(self.server, data)
-        # Load data for history details (/status/sessions/history/all)
-        self.viewedAt = toDatetime(data.attrib.get('viewedAt', NA))
-        # Load data for playlist items
-        self.playlistItemID = cast(int, data.attrib.get('playlistItemID', NA))
+    # The lambdas defer the lookups of functions defined further down this module.
+    # Data for active sessions (/status/sessions)
+    sessionKey = Attr(int)
+    username = Computed(lambda data: findUsername(data))
+    player = Computed(lambda server, data: findPlayer(server, data), server=True)
+    transcodeSession = Computed(lambda server, data: findTranscodeSession(server, data), server=True)
+    # Data for history details (/status/sessions/history/all)
+    viewedAt = Attr(lambda value: toDatetime(value))
+    # Data for playlist items
+    playlistItemID = Attr(int)
 
     def getStreamURL(self, **params):
         """ Returns a stream url that may be used by external applications such as VLC.
@@ -239,15 +735,81 @@ def buildItem(server, elem, initpath, bytag=False):
         Raises:
             UnknownType: Unknown library type.
     """
+    cls = _itemClass(elem, bytag)
+    if getattr(server, 'identityMap', None) is not None:
+        return _buildIdentified(server, cls, elem, initpath)
+    return cls(server, elem, initpath)
+
+
+def _itemClass(elem, bytag=False):
+    # Returns the registered library type class to build elem with.
     libtype = elem.tag if bytag else elem.attrib.get('type')
     if libtype == 'photo' and elem.tag == 'Directory':
         libtype = 'photoalbum'
     if libtype in LIBRARY_TYPES:
-        cls = LIBRARY_TYPES[libtype]
-        return cls(server, elem, initpath)
+        return LIBRARY_TYPES[libtype]
     raise UnknownType('Unknown library type: %s' % libtype)
 
 
+def _buildIdentified(server, cls, elem, initpath):
+    # Returns the object already in server.identityMap for this ratingKey (updated in
+    # place unless that would replace full data with a partial listing) or a new one.
+    # Elements describing one occurrence of an item (session, history entry, playlist
+    # item) always build a new object.
+    ratingKey = elem.attrib.get('ratingKey')
+    if not ratingKey or any(a in elem.attrib for a in ('sessionKey', 'viewedAt', 'playlistItemID')):
+        return cls(server, elem, initpath)
+    item = server.identityMap.get(ratingKey)
+    if item is None or type(item) is not cls:
+        item = cls(server, elem, initpath)
+        server.identityMap[ratingKey] = item
+    elif initpath == item.key or item.isPartialObject():
+        item.initpath = initpath
+        item._loadData(elem)
+    return item
+
+
+def buildRecord(elem, fields=None, bytag=False):
+    """ Returns an immutable namedtuple (ex: MovieRecord) holding the attributes of elem
+        decoded as its library type object would decode them, but without building the
+        object. Records keep no server reference and never reload; attributes missing from
+        elem are None (or their declared default, ex: viewCount 0).
+
+        Parameters:
+            elem (ElementTree): XML data needed to build the record.
+            fields (list<str>): Attributes to include (defaults to all attributes read from
+                the element; list attributes like media or genres can not be included).
+            bytag (bool): Find the library type from the tag instead of the type attribute.
+
+        Raises:
+            BadRequest: A field is a list or needs the server.
+            UnknownType: Unknown library type.
+    """
+    cls = _itemClass(elem, bytag)
+    key = (cls, tuple(fields) if fields else None)
+    if key not in _RECORD_LOADERS:
+        _RECORD_LOADERS[key] = _recordLoader(cls, key[1])
+    return _RECORD_LOADERS[key](None, elem)
+
+
+_RECORD_LOADERS = {}  # (cls, fields) -> compiled record loader
+_LISTED_LOCK = Lock()  # guards the servers' _listedattrs
+
+
+def _recordLoader(cls, fields):
+    # Returns the compiled loader of the record namedtuple for cls and fields.
+    fields = fields or [name for name, field in cls._fields.items() if _isRecordField(field)]
+    for name in fields:
+        if name in cls._fields and not _isRecordField(cls._fields[name]):
+            raise BadRequest('%s.%s can not be included in a record.' % (cls.__name__, name))
+    record = namedtuple('%sRecord' % cls.__name__, fields)
+    return _compileRecordLoader(cls, record, fields)
+
+
+def _isRecordField(field):
+    return type(field) is Attr or (type(field) is Computed and not field.server)
+
+
 def cast(func, value):
     """ Cast the specified value to the specified type (returned by func). Currently this
         only support int, float, bool. Should be extended if needed.
@@ -278,17 +840,15 @@ def findKey(server, key):
         Raises:
             NotFound: Unable to find key
     """
-    path = '/library/metadata/{0}'.format(key)
     try:
-        # Item seems to be the first sub element
-        elem = server.query(path)[0]
-        return buildItem(server, elem, path)
+        return server.fetchItem(key)
     except:
         raise NotFound('Unable to find key: %s' % key)
 
 
 def findItem(server, path, title):
-    """ Finds and builds a object based on title.
+    """ Finds and builds a object based on title. The response is streamed and the
+        download stops as soon as the item is found.
 
         Parameters:
             server (:class:`~plexapi.server.PlexServer`): PlexServer object this is from.
@@ -298,7 +858,7 @@ def findItem(server, path, title):
         Raises:
             NotFound: Unable to find item.
     """
-    for elem in server.query(path):
+    for elem in iterElems(server, path):
         if elem.attrib.get('title').lower() == title.lower():
             return buildItem(server, elem, path)
     raise NotFound('Unable to find item: %s' % title)
@@ -415,7 +975,70 @@ def listChoices(server, path):
     return {c.attrib['title']: c.attrib['key'] for c in server.query(path)}
 
 
-def listItems(server, path, libtype=None, watched=None, bytag=False):
+def iterElems(server, path):
+    """ Streams the response for path and yields each child element of the returned
+        container as soon as its end tag is parsed. Yielded elements are detached from
+        the container, so memory use stays flat no matter how large the response is.
+        Closing the generator early stops downloading the rest of the response.
+
+        Parameters:
+            server (:class:`~plexapi.server.PlexServer`): PlexServer object this is from.
+            path (str): Relative path to request XML data from.
+    """
+    depth, root = 0, None
+    events = server.iterparse(path)
+    try:
+        for event, elem in events:
+            if event == 'start':
+                root = elem if root is None else root
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 1:
+                root.remove(elem)
+                yield elem
+    finally:
+        events.close()
+
+
+def iterItems(server, path, libtype=None, watched=None, bytag=False, fields=None, as_records=False):
+    """ Same as :func:`~plexapi.utils.listItems()` but streams the response and yields each
+        object as soon as its XML element has been downloaded and parsed. Stop iterating
+        once you have enough results to skip downloading the rest of the response.
+
+        Parameters:
+            server (:class:`~plexapi.server.PlexServer`): PlexServer object this is from.
+            path (str): Relative path to request XML data from.
+            libtype (str): Optionally return only the specified library type.
+            watched (bool): Optionally return only watched or unwatched items.
+            bytag (bool): Set true if libtype is found in the XML tag (and not the 'type' attribute).
+            fields (list<str>): Return records of only these attributes instead of objects
+                (see :func:`~plexapi.utils.buildRecord()`).
+            as_records (bool): Return records of all attributes instead of objects.
+    """
+    for elem in iterElems(server, path):
+        if _isListed(elem, libtype, watched):
+            try:
+                if fields or as_records:
+                    yield buildRecord(elem, fields, bytag)
+                else:
+                    yield buildItem(server, elem, path, bytag)
+            except UnknownType:
+                pass
+
+
+def _isListed(elem, libtype=None, watched=None):
+    # Returns True if elem passes the libtype and watched filters of listItems.
+    if libtype and elem.attrib.get('type') != libtype:
+        return False
+    if watched is True and int(elem.attrib.get('viewCount', 0)) == 0:
+        return False
+    if watched is False and int(elem.attrib.get('viewCount', 0)) >= 1:
+        return False
+    return True
+
+
+def listItems(server, path, libtype=None, watched=None, bytag=False, fields=None, as_records=False):
     """ Returns a list of object built from :func:`~plexapi.utils.buildItem()` found
         within the specified path.
 
@@ -425,22 +1048,443 @@ def listItems(server, path, libtype=None, watched=None, bytag=False):
             libtype (str): Optionally return only the specified library type.
             watched (bool): Optionally return only watched or unwatched items.
             bytag (bool): Set true if libtype is found in the XML tag (and not the 'type' attribute).
+            fields (list<str>): Return records of only these attributes instead of objects
+                (see :func:`~plexapi.utils.buildRecord()`).
+            as_records (bool): Return records of all attributes instead of objects.
+    """
+    return buildItems(server, server.query(path), path, libtype, watched, bytag, fields, as_records)
+
+
+def buildItems(server, data, initpath, libtype=None, watched=None, bytag=False, fields=None, as_records=False):
+    """ Returns a list of objects built from each child element of data. Children of an
+        unknown library type are skipped. See :func:`~plexapi.utils.listItems()`.
+
+        Parameters:
+            server (:class:`~plexapi.server.PlexServer`): PlexServer object this is from.
+            data (ElementTree): Container returned by the server.
+            initpath (str): Relative path requested when retrieving specified `data`.
+            libtype (str): Optionally return only the specified library type.
+            watched (bool): Optionally return only watched or unwatched items.
+            bytag (bool): Set true if libtype is found in the XML tag (and not the 'type' attribute).
+            fields (list<str>): Return records of only these attributes instead of objects
+                (see :func:`~plexapi.utils.buildRecord()`).
+            as_records (bool): Return records of all attributes instead of objects.
     """
     items = []
-    for elem in server.query(path):
-        if libtype and elem.attrib.get('type') != libtype:
-            continue
-        if watched is True and int(elem.attrib.get('viewCount', 0)) == 0:
-            continue
-        if watched is False and int(elem.attrib.get('viewCount', 0)) >= 1:
+    listed = {}  # class name -> XML attributes carried by the listed elements
+    for elem in data:
+        if not _isListed(elem, libtype, watched):
             continue
         try:
-            items.append(buildItem(server, elem, path, bytag))
+            if fields or as_records:
+                items.append(buildRecord(elem, fields, bytag))
+            else:
+                items.append(buildItem(server, elem, initpath, bytag))
+                listed.setdefault(items[-1].__class__.__name__, set()).update(elem.attrib)
         except UnknownType:
             pass
+    if fields or as_records:
+        return items
+    # Remember which attributes this listing carries, see PlexPartialObject._listedWithout.
+    listedattrs = getattr(server, '_listedattrs', None)
+    if listedattrs is not None:
+        kind = _listingKind(initpath)
+        with _LISTED_LOCK:
+            for clsname, names in listed.items():
+                listedattrs.setdefault((clsname, kind), set()).update(names)
+    # Remember the items listed together, so touching a missing attribute on one
+    # partial item reloads it with its siblings in one request.
+    group = [weakref.ref(item) for item in items]
+    for index, item in enumerate(items):
+        if isinstance(item, PlexPartialObject):
+            item.__dict__['_siblings'] = (group, index)
     return items
 
 
+def _listingKind(path):
+    # Returns the kind of listing at path: the path without its query string and with
+    # ratingKeys and other ids replaced by '*' (ex: /library/metadata/*/children).
+    return re.sub(r'/\d+(?=/|$)', '/*', str(path).split('?')[0])
+
+
+def listItemsAsync(server, path, libtype=None, watched=None, bytag=False):
+    """ Same as :func:`~plexapi.utils.listItems()` but returns immediately with an
+        :class:`~multiprocessing.pool.AsyncResult`. Call `get()` on the result to wait for
+        the list of built objects. The request and object building run in the server's
+        bounded worker pool, so many listings can be fetched at once.
+
+        Parameters:
+            server (:class:`~plexapi.server.PlexServer`): PlexServer object this is from.
+            path (str): Relative path to request XML data from.
+            libtype (str): Optionally return only the specified library type.
+            watched (bool): Optionally return only watched or unwatched items.
+            bytag (bool): Set true if libtype is found in the XML tag (and not the 'type' attribute).
+    """
+    return server.pool.apply_async(listItems, (server, path, libtype, watched, bytag))
+
+
+def listPagedItems(server, path, maxresults=999999, containerSize=None, fields=None, as_records=False):
+    """ Same as :func:`~plexapi.utils.listItems()` but requests the listing in pages. After
+        the first page reports the container totalSize, the remaining pages are requested
+        concurrently (up to `plexapi.max_workers` at once) and returned in order. Page sizes
+        come from the server's adaptive :class:`~plexapi.utils.Pager` unless containerSize
+        is given.
+
+        Parameters:
+            server (:class:`~plexapi.server.PlexServer`): PlexServer object this is from.
+            path (str): Relative path to request XML data from.
+            maxresults (int): Only return the specified number of results.
+            containerSize (int): Fixed number of results to request per page (optional).
+            fields (list<str>): Return records of only these attributes instead of objects
+                (see :func:`~plexapi.utils.buildRecord()`).
+            as_records (bool): Return records of all attributes instead of objects.
+    """
+    build = lambda data: buildItems(server, data, path, fields=fields, as_records=as_records)
+    size = min(containerSize or server.pager.size, maxresults)
+    data = server.queryPage(path, 0, size)
+    results = build(data)
+    total = cast(int, data.attrib.get('totalSize'))
+    if not 0 < len(data) <= size or len(data) == total:
+        return results[:maxresults]  # everything fit or the server ignored paging
+    if total is None:
+        for page in _iterPages(server, path, build, maxresults - len(results), containerSize, len(data)):
+            results += page
+        return results[:maxresults]
+    size = min(containerSize or server.pager.size, maxresults)
+    starts = range(len(data), min(total, maxresults), size)
+    for page in mapThreaded(lambda start: build(server.queryPage(path, start, size)), starts):
+        results += page
+    return results[:maxresults]
+
+
+def iterPagedItems(server, path, maxresults=999999, containerSize=None, fields=None, as_records=False):
+    """ Same as :func:`~plexapi.utils.listPagedItems()` but returns a generator that yields
+        the results page by page. While you process one page, the next page is fetched in
+        the background. Stop iterating once you have what you need and no further pages
+        will be requested.
+
+        Parameters:
+            server (:class:`~plexapi.server.PlexServer`): PlexServer object this is from.
+            path (str): Relative path to request XML data from.
+            maxresults (int): Only return the specified number of results.
+            containerSize (int): Fixed number of results to request per page (optional).
+            fields (list<str>): Return records of only these attributes instead of objects
+                (see :func:`~plexapi.utils.buildRecord()`).
+            as_records (bool): Return records of all attributes instead of objects.
+    """
+    build = lambda data: buildItems(server, data, path, fields=fields, as_records=as_records)
+    for page in _iterPages(server, path, build, maxresults, containerSize):
+        for item in page:
+            yield item
+
+
+def _iterPages(server, path, build, maxresults, containerSize=None, start=0):
+    # Yields lists of items built with build(data) page by page, prefetching the next
+    # page in a background thread. This uses its own thread as the server pool may be
+    # running this call.
+    def fetch(start, size):
+        data = server.queryPage(path, start, size)
+        total = cast(int, data.attrib.get('totalSize'))
+        return build(data), len(data), total
+    pool = ThreadPool(1)
+    try:
+        count = 0
+        size = min(containerSize or server.pager.size, maxresults)
+        pending = pool.apply_async(fetch, (start, size))
+        while pending:
+            items, nelems, total = pending.get()
+            items = items[:maxresults - count]
+            start, count = start + nelems, count + len(items)
+            pending = None
+            more = 0 < nelems <= size and (total is None or start < total)
+            if more and count < maxresults:
+                size = min(containerSize or server.pager.size, maxresults - count)
+                pending = pool.apply_async(fetch, (start, size))
+            yield items
+    finally:
+        pool.terminate()
+
+
+def crawlItems(server, paths, containerSize=None, workers=None, fields=None, as_records=False):
+    """ Returns a generator that yields the items listed at each of paths, path after path
+        and page after page. The first pages of all paths are requested at once, and as
+        soon as one reports its container totalSize, the remaining pages of that path are
+        queued too. All pages share one pool of threads, so a crawl of many listings takes
+        about as long as paging through the largest one.
+
+        Parameters:
+            server (:class:`~plexapi.server.PlexServer`): PlexServer object this is from.
+            paths (list<str>): Relative paths to request XML data from.
+            containerSize (int): Fixed number of results to request per page (optional).
+            workers (int): Max concurrent requests (default `plexapi.max_workers`).
+            fields (list<str>): Return records of only these attributes instead of objects
+                (see :func:`~plexapi.utils.buildRecord()`).
+            as_records (bool): Return records of all attributes instead of objects.
+    """
+    if workers is None:
+        import plexapi
+        workers = plexapi.MAX_WORKERS
+    paths = list(paths)
+    build = lambda data, path: buildItems(server, data, path, fields=fields, as_records=as_records)
+    fetch = lambda path, start, size: build(server.queryPage(path, start, size), path)
+    pages = [[] for path in paths]  # pending results of the remaining pages of each path
+
+    def first(path, size):
+        data = server.queryPage(path, 0, size)
+        return build(data, path), len(data), size, cast(int, data.attrib.get('totalSize'))
+
+    def queue(i, result):
+        # Runs in the pool's result thread, before the first page result is ready.
+        items, nelems, size, total = result
+        if 0 < nelems <= size and total is not None and nelems < total:
+            size = containerSize or server.pager.size
+            for start in range(nelems, total, size):
+                pages[i].append(pool.apply_async(fetch, (paths[i], start, size)))
+    pool = ThreadPool(max(1, workers))
+    try:
+        firsts = [pool.apply_async(first, (path, containerSize or server.pager.size),
+            callback=lambda result, i=i: queue(i, result)) for i, path in enumerate(paths)]
+        for i, path in enumerate(paths):
+            items, nelems, size, total = firsts[i].get()
+            for item in items:
+                yield item
+            if total is None and nelems == size:
+                # The server didn't report the totalSize; page through the rest in order.
+                build1 = lambda data: build(data, path)
+                for page in _iterPages(server, path, build1, 999999, containerSize, nelems):
+                    for item in page:
+                        yield item
+            for page in pages[i]:
+                for item in page.get():
+                    yield item
+    finally:
+        pool.terminate()
+
+
+def listColumns(server, path, columns, maxresults=999999, containerSize=None, as_arrays=False):
+    """ Returns an OrderedDict of {column: values} for the items listed at path, read
+        straight from the XML pages without building objects. Pages are requested like
+        :func:`~plexapi.utils.listPagedItems()` and each one fills its rows of columns
+        preallocated from the container totalSize.
+
+        A column is an attribute of the items, or else of their first
+        :class:`~plexapi.media.Media` (ex: bitrate) or its first
+        :class:`~plexapi.media.MediaPart` (ex: size). Int, float and bool attributes give
+        typed columns; datetimes (ex: addedAt) give seconds since the epoch; missing
+        numbers are 0 (or the attribute default) and missing floats NaN. Other attributes
+        give lists of their values.
+
+        Parameters:
+            server (:class:`~plexapi.server.PlexServer`): PlexServer object this is from.
+            path (str): Relative path to request XML data from.
+            columns (list<str>): Attributes to return.
+            maxresults (int): Only return the specified number of results.
+            containerSize (int): Fixed number of results to request per page (optional).
+            as_arrays (bool): Return typed columns as NumPy arrays (or `array.array` when
+                NumPy isn't installed) instead of lists.
+    """
+    size = min(containerSize or server.pager.size, maxresults)
+    data = server.queryPage(path, 0, size)
+    total = cast(int, data.attrib.get('totalSize'))
+    if not 0 < len(data) <= size or len(data) == total:
+        total = len(data)  # everything fit or the server ignored paging
+    table = _Columns(columns, data[0] if len(data) else None, min(total or 0, maxresults))
+    table.fill(0, data, maxresults)
+    if total is None:
+        start = len(data)
+        while 0 < len(data) <= size and start < maxresults:
+            size = min(containerSize or server.pager.size, maxresults - start)
+            data = server.queryPage(path, start, size)
+            table.fill(start, data, maxresults - start)
+            start += len(data)
+    else:
+        count = min(total, maxresults)
+        fill = lambda start: table.fill(start, server.queryPage(path, start, size), count - start)
+        mapThreaded(fill, range(len(data), count, size))
+    return table.result(as_arrays)
+
+
+try:
+    array('q')
+    _INTCODE = 'q'
+except ValueError:  # Python 2 arrays have no long long typecode
+    _INTCODE = 'l'
+
+
+class _Columns(object):
+    # Preallocated columns filled from the XML elements of the listed items. The
+    # typecode of each column comes from the attribute declared by the class of
+    # the first element; lists hold the columns that aren't numbers. Each type of
+    # element gets a compiled function filling one row of the columns.
+    TYPECODES = {int: _INTCODE, float: 'd', bool: 'b'}
+    MISSING = {_INTCODE: 0, 'd': float('nan'), 'b': 0, None: None}
+
+    def __init__(self, names, first, size):
+        self.names = list(names)
+        self.fillers = {}  # (tag, type) -> compiled row filler
+        self.lock = Lock()
+        self.size = size
+        specs = self._sources(first) if first is not None else [(None, None)] * len(self.names)
+        self.typecodes = [self._typecode(field) for source, field in specs]
+        self.columns = [array(t, [self.MISSING[t]]) * size if t else [None] * size for t in self.typecodes]
+
+    def _sources(self, elem):
+        # Returns where to read each column in elem: from the item ('', field), its first
+        # Media or Part ('media'/'part', field) or nowhere (None, None).
+        from plexapi import media
+        try:
+            cls = _itemClass(elem)
+        except UnknownType:
+            cls = None
+        classes = [('', cls), ('media', media.Media), ('part', media.MediaPart)]
+        specs = []
+        for name in self.names:
+            spec = (None, None)
+            for source, cls in classes:
+                field = cls._fields.get(name) if cls else None
+                if type(field) is Attr:
+                    spec = (source, field)
+                    break
+            specs.append(spec)
+        return specs
+
+    def _typecode(self, field):
+        if field is not None and field.cast is toDatetime and field.format is None:
+            return _INTCODE
+        return self.TYPECODES.get(getattr(field, 'cast', None))
+
+    def _filler(self, elem):
+        # Generates the function filling one row of the columns from an element like
+        # elem; numbers are read from the XML attribute without decoding the field.
+        env = {'NA': NA, 'nan': float('nan'), 'none': lambda name: None}
+        lines = ['def _fill(columns, row, elem):', '    get = elem.attrib.get']
+        specs = self._sources(elem)
+        if any(source for source, field in specs):
+            lines += ["    media = elem.find('Media')",
+                "    part = media.find('Part') if media is not None else None",
+                '    mediaget = media.attrib.get if media is not None else none',
+                '    partget = part.attrib.get if part is not None else none']
+        for i, ((source, field), typecode) in enumerate(zip(specs, self.typecodes)):
+            env['f%s' % i] = field
+            env['m%s' % i] = self.MISSING[typecode]
+            column = '    columns[%s][row] = %%s' % i
+            if field is None:
+                lines.append(column % 'm%s' % i)
+            elif typecode is None:
+                parent = source or 'elem'
+                lines.append('    x = f%s.decode(None, %s) if %s is not None else None' % (i, parent, parent))
+                lines.append(column % '(None if x is NA else x)')
+            else:
+                if isinstance(field.default, (int, float)) and not isinstance(field.default, bool):
+                    env['m%s' % i] = field.default
+                lines.append('    v = %sget(%r)' % (source, field.attr))
+                if field.fallback is not None:
+                    lines.append('    if v is None: v = %sget(%r)' % (source, field.fallback))
+                lines += ['    if v is None:', '    ' + column % 'm%s' % i, '    else:', '        try:',
+                    '        ' + column % ('%s(v)' % ('float' if typecode == 'd' else 'int')),
+                    '        except ValueError:', '        ' + column % ('nan' if typecode == 'd' else '0')]
+        exec(compile('\n'.join(lines), '<columns filler>', 'exec'), env)
+        return env['_fill']
+
+    def fill(self, start, data, limit):
+        """ Fills the rows from start with the first limit elements of data. """
+        elems = list(data)[:max(limit, 0)]
+        if start + len(elems) > self.size:
+            with self.lock:
+                self._grow(start + len(elems))
+        columns, fillers = self.columns, self.fillers
+        for row, elem in enumerate(elems, start):
+            key = (elem.tag, elem.attrib.get('type'))
+            if key not in fillers:
+                fillers[key] = self._filler(elem)
+            fillers[key](columns, row, elem)
+
+    def _grow(self, size):
+        for i, typecode in enumerate(self.typecodes):
+            missing = self.MISSING[typecode]
+            self.columns[i] += (array(typecode, [missing]) if typecode else [missing]) * (size - self.size)
+        self.size = size
+
+    def result(self, as_arrays):
+        """ Returns the OrderedDict of columns. """
+        results = OrderedDict()
+        for name, column, typecode in zip(self.names, self.columns, self.typecodes):
+            if not as_arrays:
+                column = list(column)
+            elif numpy is not None:
+                dtype = {'d': numpy.float64, 'b': numpy.bool_}.get(typecode, typecode or object)
+                column = numpy.frombuffer(column, dtype) if typecode else numpy.array(column, dtype)
+            results[name] = column
+        return results
+
+
+def _parseEtree(data):
+    return ElementTree.fromstring(data)
+
+
+def _parseLxml(data):
+    return lxml.fromstring(data, lxml.XMLParser(resolve_entities=False))
+
+
+def _parseExpat(data):
+    # Pull events from expat and keep the first start tag (the root) as it is built.
+    root = None
+    for event, elem in ElementTree.iterparse(BytesIO(data), events=('start',)):
+        root = elem if root is None else root
+    return root
+
+
+def _iterparseLxml(source, events):
+    return lxml.iterparse(source, events=events, resolve_entities=False)
+
+
+XML_PARSERS = {'etree': _parseEtree, 'expat': _parseExpat}
+XML_ITERPARSERS = {'etree': ElementTree.iterparse, 'expat': ElementTree.iterparse}
+if lxml is not None:
+    XML_PARSERS['lxml'] = _parseLxml
+    XML_ITERPARSERS['lxml'] = _iterparseLxml
+
+
+def _xmlParser(parser):
+    # Returns the configured parser name, raising Unsupported if it's not available.
+    if parser is None:
+        import plexapi
+        parser = plexapi.XML_PARSER
+    if parser not in XML_PARSERS:
+        raise Unsupported('Unknown or unavailable XML parser: %s' % parser)
+    return parser
+
+
+def parseXML(data, parser=None):
+    """ Returns the root ElementTree object parsed from the raw response bytes. Returns None
+        if data is empty. Parsing the bytes directly avoids decoding the body to a str and
+        encoding it back again, which doubles the memory used for large responses.
+
+        Parameters:
+            data (bytes): Raw XML bytes (ex: response.content).
+            parser (str): Parser backend to use; one of `XML_PARSERS` (etree, expat, lxml).
+                Defaults to the `plexapi.xml_parser` setting.
+
+        Raises:
+            Unsupported: Unknown parser backend or the backend is not installed.
+    """
+    if not data:
+        return None
+    return XML_PARSERS[_xmlParser(parser)](data)
+
+
+def iterparseXML(source, events=('start', 'end'), parser=None):
+    """ Incrementally parses XML read from the file-like source and yields (event, element)
+        pairs as soon as each tag has been read. See :func:`~plexapi.utils.parseXML()`.
+
+        Parameters:
+            source (file): File-like object to read the XML bytes from (ex: response.raw).
+            events (tuple): Events to report ('start' and/or 'end').
+            parser (str): Parser backend to use; defaults to the `plexapi.xml_parser` setting.
+    """
+    return XML_ITERPARSERS[_xmlParser(parser)](source, events)
+
+
 def rget(obj, attrstr, default=None, delim='.'):  # pragma: no cover
     """ Returns the value at the specified attrstr location within a nexted tree of
         dicts, lists, tuples, functions, classes, etc. The lookup is done recursivley
@@ -490,6 +1534,29 @@ def searchType(libtype):
     raise NotFound('Unknown libtype: %s' % libtype)
 
 
+def mapThreaded(callback, items, workers=None):
+    """ Returns the list of <callback>(item) for each item in items, in order. The calls run
+        concurrently in a short-lived pool of threads, never more than <workers> at once.
+        The first exception raised by a call is raised again here.
+
+        Parameters:
+            callback (func): Callback function to apply to each item.
+            items (list): Items to pass to callback, one per call.
+            workers (int): Max concurrent calls (default `plexapi.max_workers`).
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [callback(item) for item in items]
+    if workers is None:
+        import plexapi
+        workers = plexapi.MAX_WORKERS
+    pool = ThreadPool(max(1, min(workers, len(items))))
+    try:
+        return pool.map(callback, items)
+    finally:
+        pool.terminate()
+
+
 def threaded(callback, listargs):
     """ Returns the result of <callback> for each set of \*args in listargs. Each call
         to <callback. is called concurrently in their own separate threads.
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+from functools import partial
 from plexapi import media, utils
 from plexapi.exceptions import NotFound
 from plexapi.utils import Playable, PlexPartialObject
@@ -8,6 +9,19 @@ NA = utils.NA
 
 class Video(PlexPartialObject):
     TYPE = None
+    listType = 'video'
+    addedAt = utils.Attr(utils.toDatetime)
+    key = utils.Attr()
+    lastViewedAt = utils.Attr(utils.toDatetime)
+    librarySectionID = utils.Attr(intern=True)
+    ratingKey = utils.Attr(int)
+    summary = utils.Attr()
+    thumb = utils.Attr()
+    title = utils.Attr()
+    titleSort = utils.Attr(fallback='title')
+    type = utils.Attr(intern=True)
+    updatedAt = utils.Attr(utils.toDatetime)
+    viewCount = utils.Attr(int, 0)
 
     def __init__(self, server, data, initpath):
         """Default class for all video types.
@@ -20,26 +34,6 @@ class Video(PlexPartialObject):
         """
         super(Video, self).__init__(data, initpath, server)
 
-    def _loadData(self, data):
-        """Used to set the attributes
-
-        Args:
-            data (Element): Usually built from server.query
-        """
-        self.listType = 'video'
-        self.addedAt = utils.toDatetime(data.attrib.get('addedAt', NA))
-        self.key = data.attrib.get('key', NA)
-        self.lastViewedAt = utils.toDatetime(data.attrib.get('lastViewedAt', NA))
-        self.librarySectionID = data.attrib.get('librarySectionID', NA)
-        self.ratingKey = utils.cast(int, data.attrib.get('ratingKey', NA))
-        self.summary = data.attrib.get('summary', NA)
-        self.thumb = data.attrib.get('thumb', NA)
-        self.title = data.attrib.get('title', NA)
-        self.titleSort = data.attrib.get('titleSort', self.title)
-        self.type = data.attrib.get('type', NA)
-        self.updatedAt = utils.toDatetime(data.attrib.get('updatedAt', NA))
-        self.viewCount = utils.cast(int, data.attrib.get('viewCount', 0))
-
     @property
     def thumbUrl(self):
         """Return url to thumb image."""
@@ -79,58 +73,53 @@ class Video(PlexPartialObject):
 @utils.register_libtype
 class Movie(Video, Playable):
     TYPE = 'movie'
-
-    def _loadData(self, data):
-        """Used to set the attributes
-
-        Args:
-            data (Element): XML reponse from PMS as Element
-                            normally built from server.query
-        """
-        Video._loadData(self, data)
-        Playable._loadData(self, data)
-        self.art = data.attrib.get('art', NA)
-        self.audienceRating = utils.cast(
-            float, data.attrib.get('audienceRating', NA))
-        self.audienceRatingImage = data.attrib.get('audienceRatingImage', NA)
-        self.chapterSource = data.attrib.get('chapterSource', NA)
-        self.contentRating = data.attrib.get('contentRating', NA)
-        self.duration = utils.cast(int, data.attrib.get('duration', NA))
-        self.guid = data.attrib.get('guid', NA)
-        self.originalTitle = data.attrib.get('originalTitle', NA)
-        self.originallyAvailableAt = utils.toDatetime(
-            data.attrib.get('originallyAvailableAt', NA), '%Y-%m-%d')
-        self.primaryExtraKey = data.attrib.get('primaryExtraKey', NA)
-        self.rating = data.attrib.get('rating', NA)
-        self.ratingImage = data.attrib.get('ratingImage', NA)
-        self.studio = data.attrib.get('studio', NA)
-        self.tagline = data.attrib.get('tagline', NA)
-        self.userRating = utils.cast(float, data.attrib.get('userRating', NA))
-        self.viewOffset = utils.cast(int, data.attrib.get('viewOffset', 0))
-        self.year = utils.cast(int, data.attrib.get('year', NA))
-        if self.isFullObject():  # check this
-            self.collections = [media.Collection(self.server, e) for e in data if e.tag == media.Collection.TYPE]
-            self.countries = [media.Country(self.server, e) for e in data if e.tag == media.Country.TYPE]
-            self.directors = [media.Director(self.server, e) for e in data if e.tag == media.Director.TYPE]
-            self.genres = [media.Genre(self.server, e) for e in data if e.tag == media.Genre.TYPE]
-            self.media = [media.Media(self.server, e, self.initpath, self) for e in data if e.tag == media.Media.TYPE]
-            self.producers = [media.Producer(self.server, e) for e in data if e.tag == media.Producer.TYPE]
-            self.roles = [media.Role(self.server, e) for e in data if e.tag == media.Role.TYPE]
-            self.writers = [media.Writer(self.server, e) for e in data if e.tag == media.Writer.TYPE]
-            self.fields = [media.Field(e) for e in data if e.tag == media.Field.TYPE]
-            self.videoStreams = utils.findStreams(self.media, 'videostream')
-            self.audioStreams = utils.findStreams(self.media, 'audiostream')
-            self.subtitleStreams = utils.findStreams(
-                self.media, 'subtitlestream')
+    art = utils.Attr()
+    audienceRating = utils.Attr(float)
+    audienceRatingImage = utils.Attr()
+    chapterSource = utils.Attr()
+    contentRating = utils.Attr(intern=True)
+    duration = utils.Attr(int)
+    guid = utils.Attr()
+    originalTitle = utils.Attr()
+    originallyAvailableAt = utils.Attr(utils.toDatetime, format='%Y-%m-%d')
+    primaryExtraKey = utils.Attr()
+    rating = utils.Attr()
+    ratingImage = utils.Attr()
+    studio = utils.Attr(intern=True)
+    tagline = utils.Attr()
+    userRating = utils.Attr(float)
+    viewOffset = utils.Attr(int, 0)
+    year = utils.Attr(int)
+    collections = utils.Elems(media.Collection, full=True)
+    countries = utils.Elems(media.Country, full=True)
+    directors = utils.Elems(media.Director, full=True)
+    fields = utils.Elems(media.Field, build=lambda server, elem: media.Field(elem), full=True)
+    genres = utils.Elems(media.Genre, full=True)
+    producers = utils.Elems(media.Producer, full=True)
+    roles = utils.Elems(media.Role, full=True)
+    writers = utils.Elems(media.Writer, full=True)
+    media = utils.Elems(media.Media, parent=True, full=True)  # last, it hides the media module
 
     @property
     def actors(self):
         return self.roles
 
+    @property
+    def audioStreams(self):
+        return utils.findStreams(self.media or [], 'audiostream')
+
     @property
     def isWatched(self):
         return bool(self.viewCount > 0)
 
+    @property
+    def subtitleStreams(self):
+        return utils.findStreams(self.media or [], 'subtitlestream')
+
+    @property
+    def videoStreams(self):
+        return utils.findStreams(self.media or [], 'videostream')
+
     @property
     def location(self):
         """ This does not exist in plex xml response but is added to have a common
@@ -164,36 +153,29 @@ class Movie(Video, Playable):
 @utils.register_libtype
 class Show(Video):
     TYPE = 'show'
+    key = utils.Attr(lambda key: key.replace('/children', ''))  # incase this was loaded from search etc
+    art = utils.Attr()
+    banner = utils.Attr()
+    childCount = utils.Attr(int)
+    contentRating = utils.Attr(intern=True)
+    duration = utils.Attr(int)
+    guid = utils.Attr()
+    index = utils.Attr()
+    leafCount = utils.Attr(int)
+    location = utils.Computed(partial(utils.findLocations, single=True))
+    originallyAvailableAt = utils.Attr(utils.toDatetime, format='%Y-%m-%d')
+    rating = utils.Attr(float)
+    studio = utils.Attr(intern=True)
+    theme = utils.Attr()
+    viewedLeafCount = utils.Attr(int)
+    year = utils.Attr(int)
+    genres = utils.Elems(media.Genre, full=True)
+    roles = utils.Elems(media.Role, full=True)
 
-    def _loadData(self, data):
-        """Used to set the attributes
-
-        Args:
-            data (Element): Usually built from server.query
-        """
-        Video._loadData(self, data)
-        # Incase this was loaded from search etc
-        self.key = self.key.replace('/children', '')
-        self.art = data.attrib.get('art', NA)
-        self.banner = data.attrib.get('banner', NA)
-        self.childCount = utils.cast(int, data.attrib.get('childCount', NA))
-        self.contentRating = data.attrib.get('contentRating', NA)
-        self.duration = utils.cast(int, data.attrib.get('duration', NA))
-        self.guid = data.attrib.get('guid', NA)
-        self.index = data.attrib.get('index', NA)
-        self.leafCount = utils.cast(int, data.attrib.get('leafCount', NA))
-        self.location = utils.findLocations(data, single=True) or NA
-        self.originallyAvailableAt = utils.toDatetime(
-            data.attrib.get('originallyAvailableAt', NA), '%Y-%m-%d')
-        self.rating = utils.cast(float, data.attrib.get('rating', NA))
-        self.studio = data.attrib.get('studio', NA)
-        self.theme = data.attrib.get('theme', NA)
-        self.viewedLeafCount = utils.cast(
-            int, data.attrib.get('viewedLeafCount', NA))
-        self.year = utils.cast(int, data.attrib.get('year', NA))
-        if self.isFullObject():  # will be fixed with docs.
-            self.genres = [media.Genre(self.server, e) for e in data if e.tag == media.Genre.TYPE]
-            self.roles = [media.Role(self.server, e) for e in data if e.tag == media.Role.TYPE]
+    def __init__(self, server, data, initpath):
+        # Cached (season, episode) -> episode ratingKey, kept across reloads
+        self._episodeKeys = {}
+        super(Show, self).__init__(server, data, initpath)
 
     @property
     def actors(self):
@@ -227,7 +209,10 @@ class Show(Video):
                 watched (bool): Defaults to None. Exclude watched episodes
         """
         leavesKey = '/library/metadata/%s/allLeaves' % self.ratingKey
-        return utils.listItems(self.server, leavesKey, watched=watched)
+        episodes = utils.listItems(self.server, leavesKey, watched=watched)
+        for ep in episodes:
+            self._episodeKeys[(utils.cast(int, ep.parentIndex), ep.index)] = ep.ratingKey
+        return episodes
 
     def episode(self, title=None, season=None, episode=None):
         """Find a episode using a title or season and episode.
@@ -253,6 +238,11 @@ class Show(Video):
                 >>> plex.search('The blacklist')[0].episode('The Freelancer')
                 <Episode:116263:The.Freelancer>
 
+           Note:
+                Season and episode are looked up through the season, requesting only
+                that episode. The ratingKey found is kept on this show, so asking for
+                the same episode again only fetches the episode itself.
+
         """
         if not title and (not season or not episode):
             raise TypeError('Missing argument: title or season and episode are required')
@@ -262,12 +252,20 @@ class Show(Video):
             return utils.findItem(self.server, path, title)
 
         elif season and episode:
-            results = [i for i in self.episodes()
-                       if i.seasonNumber == season and i.index == episode]
-            if results:
-                return results[0]
-            else:
-                raise NotFound('Couldnt find %s S%s E%s' % (self.title, season, episode))
+            season, episode = int(season), int(episode)
+            key = self._episodeKeys.get((season, episode))
+            if key is not None:
+                return self.server.fetchItem(key)
+            path = '/library/metadata/%s/children' % self.ratingKey
+            for elem in utils.iterElems(self.server, path):
+                index = utils.cast(int, elem.attrib.get('index'))
+                if elem.attrib.get('type') == Season.TYPE and index == season:
+                    item = _findEpisode(self.server, elem.attrib.get('ratingKey'), episode)
+                    if item is not None:
+                        self._episodeKeys[(season, episode)] = item.ratingKey
+                        return item
+                    break
+            raise NotFound('Couldnt find %s S%s E%s' % (self.title, season, episode))
 
     def watched(self):
         """Return a list of watched episodes"""
@@ -305,22 +303,18 @@ class Show(Video):
 @utils.register_libtype
 class Season(Video):
     TYPE = 'season'
+    key = utils.Attr(lambda key: key.replace('/children', ''))
+    leafCount = utils.Attr(int)
+    index = utils.Attr(int)
+    parentKey = utils.Attr(intern=True)
+    parentRatingKey = utils.Attr(int)
+    parentTitle = utils.Attr(intern=True)
+    viewedLeafCount = utils.Attr(int)
 
-    def _loadData(self, data):
-        """Used to set the attributes
-
-        Args:
-            data (Element): Usually built from server.query
-        """
-        Video._loadData(self, data)
-        self.key = self.key.replace('/children', '')
-        self.leafCount = utils.cast(int, data.attrib.get('leafCount', NA))
-        self.index = utils.cast(int, data.attrib.get('index', NA))
-        self.parentKey = data.attrib.get('parentKey', NA)
-        self.parentRatingKey = utils.cast(int, data.attrib.get('parentRatingKey', NA))
-        self.parentTitle = data.attrib.get('parentTitle', NA)
-        self.viewedLeafCount = utils.cast(
-            int, data.attrib.get('viewedLeafCount', NA))
+    def __init__(self, server, data, initpath):
+        # Cached episode -> episode ratingKey, kept across reloads
+        self._episodeKeys = {}
+        super(Season, self).__init__(server, data, initpath)
 
     @property
     def isWatched(self):
@@ -375,10 +369,15 @@ class Season(Video):
             path = '/library/metadata/%s/children' % self.ratingKey
             return utils.findItem(self.server, path, title)
         elif episode:
-            results = [i for i in self.episodes() if i.seasonNumber == self.index and i.index == episode]
-            if results:
-                return results[0]
-            raise NotFound('Couldnt find %s.Season %s Episode %s.' % (self.grandparentTitle, self.index. episode))
+            episode = int(episode)
+            key = self._episodeKeys.get(episode)
+            if key is not None:
+                return self.server.fetchItem(key)
+            item = _findEpisode(self.server, self.ratingKey, episode)
+            if item is None:
+                raise NotFound('Couldnt find %s.Season %s Episode %s.' % (self.parentTitle, self.index, episode))
+            self._episodeKeys[episode] = item.ratingKey
+            return item
 
     def get(self, title):
         """Get a episode with a matching title.
@@ -393,7 +392,7 @@ class Season(Video):
 
     def show(self):
         """Return this seasons show."""
-        return utils.listItems(self.server, self.parentKey)[0]
+        return self.server.fetchItem(self.parentKey)
 
     def watched(self):
         """Returns a list of watched Episode"""
@@ -418,9 +417,41 @@ class Season(Video):
         return downloaded
 
 
+def _findEpisode(server, seasonKey, episode):
+    # Returns the episode numbered episode of a season, or None. Only that episode is
+    # requested; the index is checked again in case the server ignores the filter.
+    path = '/library/metadata/%s/children?index=%s' % (seasonKey, episode)
+    for elem in utils.iterElems(server, path):
+        if utils.cast(int, elem.attrib.get('index')) == episode:
+            return utils.buildItem(server, elem, path)
+
+
 @utils.register_libtype
 class Episode(Video, Playable):
     TYPE = 'episode'
+    art = utils.Attr()
+    chapterSource = utils.Attr()
+    contentRating = utils.Attr(intern=True)
+    duration = utils.Attr(int)
+    grandparentArt = utils.Attr(intern=True)
+    grandparentKey = utils.Attr(intern=True)
+    grandparentRatingKey = utils.Attr(int)
+    grandparentTheme = utils.Attr()
+    grandparentThumb = utils.Attr(intern=True)
+    grandparentTitle = utils.Attr(intern=True)
+    guid = utils.Attr()
+    index = utils.Attr(int)
+    originallyAvailableAt = utils.Attr(utils.toDatetime, format='%Y-%m-%d')
+    parentIndex = utils.Attr(intern=True)
+    parentKey = utils.Attr(intern=True)
+    parentRatingKey = utils.Attr(int)
+    parentThumb = utils.Attr(intern=True)
+    rating = utils.Attr(float)
+    viewOffset = utils.Attr(int, 0)
+    year = utils.Attr(int)
+    directors = utils.Elems(media.Director)
+    writers = utils.Elems(media.Writer)
+    media = utils.Elems(media.Media, parent=True)  # last, it hides the media module
 
     def _loadData(self, data):
         """Used to set the attributes
@@ -429,38 +460,6 @@ class Episode(Video, Playable):
                 data (Element): Usually built from server.query
         """
         Video._loadData(self, data)
-        Playable._loadData(self, data)
-        self.art = data.attrib.get('art', NA)
-        self.chapterSource = data.attrib.get('chapterSource', NA)
-        self.contentRating = data.attrib.get('contentRating', NA)
-        self.duration = utils.cast(int, data.attrib.get('duration', NA))
-        self.grandparentArt = data.attrib.get('grandparentArt', NA)
-        self.grandparentKey = data.attrib.get('grandparentKey', NA)
-        self.grandparentRatingKey = utils.cast(int, data.attrib.get('grandparentRatingKey', NA))
-        self.grandparentTheme = data.attrib.get('grandparentTheme', NA)
-        self.grandparentThumb = data.attrib.get('grandparentThumb', NA)
-        self.grandparentTitle = data.attrib.get('grandparentTitle', NA)
-        self.guid = data.attrib.get('guid', NA)
-        self.index = utils.cast(int, data.attrib.get('index', NA))
-        self.originallyAvailableAt = utils.toDatetime(data.attrib.get('originallyAvailableAt', NA), '%Y-%m-%d')
-        self.parentIndex = data.attrib.get('parentIndex', NA)
-        self.parentKey = data.attrib.get('parentKey', NA)
-        self.parentRatingKey = utils.cast(int, data.attrib.get('parentRatingKey', NA))
-        self.parentThumb = data.attrib.get('parentThumb', NA)
-        self.rating = utils.cast(float, data.attrib.get('rating', NA))
-        self.viewOffset = utils.cast(int, data.attrib.get('viewOffset', 0))
-        self.year = utils.cast(int, data.attrib.get('year', NA))
-        self.directors = [media.Director(self.server, e) for e in data if e.tag == media.Director.TYPE]
-        self.media = [media.Media(self.server, e, self.initpath, self) for e in data if e.tag == media.Media.TYPE]
-        self.writers = [media.Writer(self.server, e) for e in data if e.tag == media.Writer.TYPE]
-        self.videoStreams = utils.findStreams(self.media, 'videostream')
-        self.audioStreams = utils.findStreams(self.media, 'audiostream')
-        self.subtitleStreams = utils.findStreams(self.media, 'subtitlestream')
-        # data for active sessions and history
-        self.sessionKey = utils.cast(int, data.attrib.get('sessionKey', NA))
-        self.username = utils.findUsername(data)
-        self.player = utils.findPlayer(self.server, data)
-        self.transcodeSession = utils.findTranscodeSession(self.server, data)
         # Cached season number
         self._seasonNumber = None
 
@@ -470,11 +469,23 @@ class Episode(Video, Playable):
         title = self.title.replace(' ', '.')[0:20].encode('utf8')
         return '<%s:%s:%s:S%s:E%s:%s>' % (clsname, key, self.grandparentTitle, self.seasonNumber, self.index, title)
 
+    @property
+    def audioStreams(self):
+        return utils.findStreams(self.media or [], 'audiostream')
+
     @property
     def isWatched(self):
         """Returns True if watched, False if not."""
         return bool(self.viewCount > 0)
 
+    @property
+    def subtitleStreams(self):
+        return utils.findStreams(self.media or [], 'subtitlestream')
+
+    @property
+    def videoStreams(self):
+        return utils.findStreams(self.media or [], 'videostream')
+
     @property
     def seasonNumber(self):
         """Return this episode seasonnumber."""
@@ -490,11 +501,11 @@ class Episode(Video, Playable):
 
     def season(self):
         """Return this episode Season"""
-        return utils.listItems(self.server, self.parentKey)[0]
+        return self.server.fetchItem(self.parentKey)
 
     def show(self):
         """Return this episodes Show"""
-        return utils.listItems(self.server, self.grandparentKey)[0]
+        return self.server.fetchItem(self.grandparentKey)
 
     @property
     def location(self):
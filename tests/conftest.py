@@ -146,3 +146,67 @@ def monkeydownload(request, monkeypatch):
     monkeypatch.setattr('plexapi.utils.download', partial(plexapi.utils.download, mocked=True))
     yield
     monkeypatch.undo()
+
+
+class FakeServer(object):
+    """ Offline stand-in for a PlexServer answering requests from canned XML responses.
+        responses maps paths (with or without the query string) to XML strings; pages are
+        sliced from the full response, which sets the totalSize itself (if any). Requests
+        sent with another method than GET are recorded in methods as (name, path).
+    """
+    autoreload = 'eager'
+    identityMap = None
+    keepXML = True
+    lazy = False
+
+    def __init__(self, responses=None):
+        from collections import Counter
+        self.responses = {'/library/': '<MediaContainer title1="Plex Library" />'}
+        self.responses.update(responses or {})
+        self.queries = []
+        self.methods = []
+        self.session = requests.Session()  # only its methods are used, nothing is sent
+        self.reloads = Counter()
+        self._listedattrs = {}
+        self._library = None
+
+    @property
+    def library(self):
+        from plexapi.library import Library
+        if self._library is None:
+            self._library = Library(self, self.query('/library/'))
+        return self._library
+
+    def url(self, path):
+        return 'http://fake:32400%s' % path
+
+    def _response(self, path):
+        self.queries.append(path)
+        response = self.responses.get(path, self.responses.get(path.split('?')[0]))
+        if response is None:
+            from plexapi.exceptions import NotFound
+            raise NotFound('No canned response for %s' % path)
+        return response.encode('utf8')
+
+    def query(self, path, method=None):
+        if method is not None:
+            self.methods.append((method.__name__, path))
+        return plexapi.utils.parseXML(self._response(path))
+
+    def queryPage(self, path, start, size):
+        data = self.query(path)
+        children = list(data)[start:start + size]
+        for child in list(data):
+            data.remove(child)
+        data.extend(children)
+        return data
+
+    def iterparse(self, path):
+        from io import BytesIO
+        return plexapi.utils.iterparseXML(BytesIO(self._response(path)))
+
+
+@pytest.fixture()
+def fakeserver():
+    """ Returns FakeServer, to build offline servers from canned responses. """
+    return FakeServer
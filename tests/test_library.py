@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import pytest
+from plexapi import utils
 from plexapi.exceptions import NotFound
 
 
@@ -60,9 +61,19 @@ def test_library_recentlyAdded(pms):
     assert len(list(pms.library.recentlyAdded()))
 
 
+def test_library_Library_all(pms):
+    items = pms.library.all(containerSize=5)
+    expected = [item for section in pms.library.sections() for item in section.all()]
+    assert items == expected
+    assert next(pms.library.iterAll()) == expected[0]
+
+
 def test_library_get(pms):
     m = pms.library.get('16 blocks')
     assert m.title == '16 Blocks'
+    assert pms.library.get('no such title') is None
+    index = pms.library.titleIndex()
+    assert pms.library.get(' 16  BLOCKS', index=index) == m
 
 
 def test_library_Library_cleanBundle(pms):
@@ -159,3 +170,149 @@ def test_crazy_search(pms, a_movie):
     assert movie in movies.search(year=['2006', '2007']), 'Unable to search movie by year.'
     assert movie not in movies.search(year=2007), 'Unable to filter movie by year.'
     assert movie in movies.search(actor=movie.actors[0].id)
+
+
+def test_library_section_searchAsync(pms):
+    results = [s.searchAsync(maxresults=5) for s in pms.library.sections()]
+    assert all(r.get() for r in results)
+
+
+def test_library_section_iterSearch(a_movie_section):
+    items = a_movie_section.iterSearch(sort='titleSort')
+    assert next(items) == a_movie_section.search(sort='titleSort', maxresults=1)[0]
+    items.close()
+    assert list(a_movie_section.iterSearch()) == a_movie_section.search()
+
+
+def test_library_section_stats(pms, a_movie_section):
+    stats = a_movie_section.stats()
+    movies = a_movie_section.all()
+    assert stats.items == len(movies)
+    assert stats.media >= stats.items
+    assert stats.parts >= stats.media
+    assert stats.size == sum(part.size for movie in movies for part in movie.iterParts())
+    assert sum(stats.videoCodecs.values()) <= stats.media
+    total = pms.library.stats()
+    assert total.items >= stats.items
+    assert total.size >= stats.size
+
+
+def test_library_section_filterLookup(a_movie_section):
+    a_movie_section.clearFilterCache()
+    lookup = a_movie_section.filterLookup('genre')
+    assert lookup is a_movie_section.filterLookup('genre')
+    assert lookup.titles
+    title, key = next(iter(lookup.titles.items()))
+    assert lookup.resolve(title) == [key]
+    assert a_movie_section.search(genre=title) == a_movie_section.search(genre=key)
+    a_movie_section.clearFilterCache()
+    assert lookup is not a_movie_section.filterLookup('genre')
+
+
+def test_library_section_cache(pms):
+    section = pms.library.section('Movies')
+    assert pms.library.sectionByID(section.key) is section
+    assert pms.library.sectionByUUID(section.uuid) is section
+    pms.library.clearSectionCache()
+    assert pms.library.section('Movies') is not section
+
+
+def test_library_LibraryStats():
+    from plexapi.library import LibraryStats
+    movie = ('<Video duration="100"><Media videoCodec="h264" audioCodec="aac" container="mkv">'
+        '<Part size="10" /><Part size="20" /></Media><Media container="avi"><Part size="" /></Media></Video>')
+    stats, other = LibraryStats(), LibraryStats()
+    stats.add(utils.parseXML(movie.encode('utf8')))
+    other.add(utils.parseXML(b'<Track><Media audioCodec="flac"><Part size="5" /></Media></Track>'))
+    stats.update(other)
+    assert (stats.items, stats.media, stats.parts, stats.size, stats.duration) == (2, 3, 4, 35, 100)
+    assert stats.containers == {'mkv': 1, 'avi': 1}
+    assert stats.audioCodecs == {'aac': 1, 'flac': 1}
+    assert stats.videoCodecs == {'h264': 1}
+    assert not stats.videoResolutions
+
+
+def test_library_FilterLookup():
+    from collections import namedtuple
+    from plexapi.library import FilterLookup
+    Choice = namedtuple('Choice', ['key', 'title'])
+    lookup = FilterLookup([Choice('1', 'Action'), Choice('2', 'Action Comedy'), Choice('a%2520b', 'Drama')])
+    assert len(lookup) == 3
+    assert lookup.resolve('1') == ['1']
+    assert lookup.resolve('drama') == ['a b']
+    assert sorted(lookup.resolve('act')) == ['1', '2']
+    assert lookup.resolve('western') == []
+    for i in range(FilterLookup.PARTIAL_MAX):
+        lookup.resolve('x%s' % i)
+    assert len(lookup._partial) == FilterLookup.PARTIAL_MAX
+    assert 'act' not in lookup._partial and 'x0' in lookup._partial
+    assert sorted(lookup.resolve('act')) == ['1', '2']
+
+
+def test_library_Library_section_cache(fakeserver):
+    server = fakeserver({'/library/sections': '<MediaContainer><Directory type="movie" key="1" '
+        'title="Movies" uuid="u1" /><Directory type="show" key="2" title="TV Shows" uuid="u2" /></MediaContainer>'})
+    movies = server.library.section('Movies')
+    assert server.library.sectionByID('1') is movies
+    assert server.library.sectionByID(1) is movies
+    assert server.library.sectionByUUID('u2').title == 'TV Shows'
+    assert len(server.library) == 2
+    assert server.queries.count('/library/sections') == 1
+    with pytest.raises(NotFound):
+        server.library.section('Music')
+    assert server.queries.count('/library/sections') == 2
+    server.library.clearSectionCache()
+    assert server.library.section('Movies') is not movies
+    assert server.queries.count('/library/sections') == 3
+
+
+def test_library_Library_add_delete(fakeserver):
+    listing = '<MediaContainer>%s</MediaContainer>'
+    movies = '<Directory type="movie" key="1" title="Movies" uuid="u1" />'
+    shows = '<Directory type="show" key="2" title="TV Shows" uuid="u2" />'
+    server = fakeserver({'/library/sections': listing % movies, '/library/sections/1': '<MediaContainer />'})
+    library = server.library
+    old = library.section('Movies')
+    server.responses['/library/sections'] = listing % (movies + shows)
+    added = library.add('TV Shows', 'show', 'com.plexapp.agents.thetvdb', 'Plex Series Scanner', '/tv')
+    assert added.key == '2' and added.title == 'TV Shows'
+    method, path = server.methods[-1]
+    assert method == 'post' and path.startswith('/library/sections?')
+    assert 'name=TV+Shows' in path and 'location=%2Ftv' in path and 'language=en' in path
+    assert library.section('Movies') is not old
+    assert sorted(library._sectionsByID) == ['1', '2']
+    server.responses['/library/sections'] = listing % shows
+    library.section('Movies').delete()
+    assert server.methods[-1] == ('delete', '/library/sections/1')
+    assert sorted(library._sectionsByID) == ['2']
+    with pytest.raises(NotFound):
+        library.section('Movies')
+    # sections removed on the server are forgotten on the next listing as well
+    server.responses['/library/sections'] = listing % movies
+    library.clearSectionCache()
+    assert library.section('Movies').key == '1'
+    assert sorted(library._sectionsByID) == ['1']
+
+
+def test_library_Library_onDeck_maxresults(fakeserver):
+    from plexapi import video  # noqa: registers the library types
+    movies = ''.join('<Video type="movie" title="Movie %s" />' % i for i in range(5))
+    server = fakeserver({'/library/onDeck': '<MediaContainer totalSize="5">%s</MediaContainer>' % movies})
+    assert len(server.library.onDeck()) == 5
+    assert server.queries.count('/library/onDeck') == 1
+    items = server.library.onDeck(maxresults=3, containerSize=2)
+    assert [i.title for i in items] == ['Movie 0', 'Movie 1', 'Movie 2']
+    assert server.queries.count('/library/onDeck') == 3
+
+
+def test_library_TitleIndex():
+    from collections import namedtuple
+    from plexapi.library import TitleIndex, normalizeTitle
+    Item = namedtuple('Item', ['key', 'title'])
+    items = [Item(1, 'The  Matrix'), Item(2, 'Up'), Item(3, 'the matrix')]
+    index = TitleIndex(items)
+    assert normalizeTitle(' The\tMatrix ') == 'the matrix'
+    assert len(index) == 3
+    assert index.get('THE MATRIX') == items[0]
+    assert index.getAll('the matrix') == [items[0], items[2]]
+    assert index.get('Down') is None
@@ -97,6 +97,13 @@ def test_server_history(pms):
     assert len(history)
 
 
+def test_server_history_records(pms):
+    history = pms.history(fields=['title', 'type', 'viewedAt'])
+    assert len(history)
+    assert history[0]._fields == ('title', 'type', 'viewedAt')
+    assert not hasattr(history[0], 'server')
+
+
 def test_server_Server_query(pms):
     assert pms.query('/')
     from plexapi.server import PlexServer
@@ -194,3 +201,56 @@ def test_server_account(pms):
     assert acc.subscriptionFeatures == []
     assert acc.subscriptionState == 'Unknown'
     assert acc.username == 'testplexapi@gmail.com'
+
+
+def test_server_queryAsync(pms):
+    results = [pms.queryAsync('/library/sections') for i in range(5)]
+    assert len(set(len(r.get()) for r in results)) == 1
+
+
+def test_server_fetchItems(pms):
+    movies = pms.library.section('Movies').search()
+    items = pms.fetchItems([m.ratingKey for m in movies], chunk=2)
+    assert [i.ratingKey for i in items] == [m.ratingKey for m in movies]
+    assert all(i.isFullObject() for i in items)
+
+
+def test_server_reloadAll(pms):
+    movies = pms.library.section('Movies').search()
+    assert pms.reloadAll(movies, chunk=2) == movies
+    assert all(m.isFullObject() for m in movies)
+
+
+def test_server_identityMap(pms):
+    from plexapi.server import PlexServer
+    plex = PlexServer(pms.baseurl, pms.token, identitymap=True)
+    movie = plex.library.section('Movies').search()[0]
+    assert plex.library.section('Movies').search()[0] is movie
+    full = plex.fetchItem(movie.ratingKey)
+    assert full is movie and movie.isFullObject()
+    assert plex.library.section('Movies').search()[0].isFullObject()
+
+
+def test_server_pool(monkeypatch):
+    from threading import Event, Thread
+    from plexapi.server import PlexServer
+    monkeypatch.setattr(PlexServer, 'reload', lambda self: None)
+    pools, start = [], Event()
+
+    def getpool():
+        start.wait(5)
+        pools.append(plex.pool)
+    with PlexServer('http://localhost:32400', 'token') as plex:
+        threads = [Thread(target=getpool) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        start.set()
+        for thread in threads:
+            thread.join()
+        assert len(set(map(id, pools))) == 1
+        pool = pools[0]
+        assert pool.apply_async(lambda: 42).get(5) == 42
+    assert plex._pool is None
+    assert not any(worker.is_alive() for worker in pool._pool)
+    assert plex.pool is not pool
+    plex.close()
@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
-import pytest
+import pytest, time
+from threading import Event, Thread
 import plexapi.utils as utils
-from plexapi.exceptions import NotFound
+from plexapi.exceptions import BadRequest, NotFound, Unsupported
 
 
 def test_utils_toDatetime():
@@ -15,6 +16,13 @@ def _test_utils_threaded():
     pass
 
 
+def test_utils_mapThreaded():
+    assert utils.mapThreaded(lambda x: x * 2, range(20), workers=4) == list(range(0, 40, 2))
+    assert utils.mapThreaded(str, []) == []
+    with pytest.raises(ZeroDivisionError):
+        utils.mapThreaded(lambda x: 1 / x, [1, 0, 2])
+
+
 def test_utils_searchType():
     st = utils.searchType('movie')
     assert st == 1
@@ -29,6 +37,14 @@ def _test_utils_listItems():
     pass
 
 
+def test_utils_iterItems(pms):
+    path = '/library/sections/1/all'
+    assert list(utils.iterItems(pms, path)) == utils.listItems(pms, path)
+    items = utils.iterItems(pms, path)
+    assert next(items)
+    items.close()
+
+
 def _test_utils_listChoices(pms):
     # TODO: Implement test_utils_listChoices
     pass
@@ -39,6 +55,30 @@ def test_utils_joinArgs():
     assert utils.joinArgs(test_dict) == '?genre=action&type=1337'
 
 
+def test_utils_Pager():
+    pager = utils.Pager(size=50, minsize=10, maxsize=300, latency=1.0, maxbytes=10 ** 6)
+    assert pager.update(50, 0.1, 1000) == 100  # fast pages grow (at most 2x)
+    assert pager.update(100, 0.5, 1000) == 200
+    assert pager.update(200, 0.5, 1000) == 300  # never above maxsize
+    assert pager.update(300, 1.5, 1000) == 200  # slow pages shrink
+    assert pager.update(200, 0.5, 10 ** 6) == 200  # capped by maxbytes
+    assert pager.update(200, 60, 1000) == 100
+    assert pager.update(100, 60, 1000) == 50
+    assert len(pager.samples) == 7
+    assert utils.Pager(size=5000, maxsize=300).size == 300
+
+
+def test_utils_parseXML():
+    data = b'<MediaContainer size="2"><Video title="a" /><Video title="b" /></MediaContainer>'
+    for parser in utils.XML_PARSERS:
+        root = utils.parseXML(data, parser)
+        assert root.attrib['size'] == '2'
+        assert [e.attrib['title'] for e in root] == ['a', 'b']
+    assert utils.parseXML(b'') is None
+    with pytest.raises(Unsupported):
+        utils.parseXML(data, 'kekekekeke')
+
+
 def test_utils_isInt():
     assert utils.isInt(1) is True
     assert utils.isInt('got_you') is False
@@ -105,3 +145,158 @@ def test_utils_download(a_episode):
     assert with_session
     img = utils.download(a_episode.thumbUrl, filename=a_episode.title, mocked=True)
     assert img
+
+
+def test_utils_ResponseCache():
+    cache = utils.ResponseCache({'/library/sections': 60, '/library/sections/*/all': 0}, maxsize=2)
+    assert cache.ttl('/library/sections') == 60
+    assert cache.ttl('/library/sections/1/all?type=1') == 0
+    assert cache.ttl('/status/sessions') == 0
+    assert cache.isAction('PUT', '/library/sections')
+    assert cache.isAction('GET', '/library/sections/1/refresh')
+    assert cache.isAction('GET', '/:/scrobble?key=1')
+    assert not cache.isAction('GET', '/library/sections/1/all?refresh=1')
+    cache.set('/a', 'a', 60)
+    cache.set('/b', 'b', 60)
+    cache.get('/a')
+    cache.set('/c', 'c', 60)  # evicts /b, the least recently used
+    assert cache.get('/b') is None
+    assert cache.get('/a')[0] == 'a'
+    cache.invalidate('/c')
+    assert len(cache) == 1
+    cache.set('/a', b'mine', 60, headers={'X-Plex-Token': 'a'})
+    assert cache.get('/a', {'X-Plex-Token': 'a'})[0] == b'mine'
+    assert cache.get('/a', {'X-Plex-Token': 'b'}) is None
+    cache.set('/b', b'old', -1)
+    assert cache.get('/b')[0] == b'old'  # expired, kept for revalidation
+    cache.miss()
+    assert (cache.hits, cache.misses) == (3, 4)
+
+
+def test_utils_SingleFlight():
+    flight, started, release, calls = utils.SingleFlight(), Event(), Event(), []
+
+    def fetch(path):
+        calls.append(path)
+        started.set()
+        release.wait(5)
+        return object()
+    results = {}
+    leader = Thread(target=lambda: results.update(leader=flight.do('/a', fetch, '/a')))
+    leader.start()
+    started.wait(5)
+    follower = Thread(target=lambda: results.update(follower=flight.do('/a', fetch, '/a')))
+    follower.start()
+    while not flight.shared:
+        time.sleep(0.01)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+    assert calls == ['/a']
+    assert results['leader'] is results['follower']
+    assert flight.do('/a', fetch, '/a') is not results['leader']
+
+
+def test_utils_PlexObject_load():
+    class Stream(utils.PlexObject):
+        id = utils.Attr(int)
+        index = utils.Attr(int, -1)
+        selected = utils.Attr(bool, False)
+        type = utils.Attr(int, attr='streamType')
+        codec = utils.Attr()
+
+        def __init__(self, data):
+            self._loadData(data)
+    stream = Stream(utils.parseXML(b'<Stream id="7" streamType="2" selected="1" />'))
+    assert list(Stream._fields) == ['codec', 'id', 'index', 'selected', 'type']
+    assert (stream.id, stream.index, stream.selected, stream.type) == (7, -1, True, 2)
+    assert stream.codec is None
+
+
+def test_utils_PlexObject_slots():
+    class Tag(utils.PlexObject):
+        __slots__ = ('server',)
+        id = utils.Attr(int)
+        tag = utils.Attr()
+
+        def __init__(self, server, data):
+            self.server = server
+            self._loadData(data)
+    tag = Tag(None, utils.parseXML(b'<Genre id="3" tag="Action" />'))
+    assert not hasattr(tag, '__dict__')
+    assert (tag.id, tag.tag, tag.server) == (3, 'Action', None)
+    assert list(Tag._fields) == ['id', 'tag']
+
+
+def test_utils_Attr_intern():
+    class Part(utils.PlexObject):
+        container = utils.Attr(intern=True)
+        file = utils.Attr()
+
+        def __init__(self, data):
+            self._loadData(data)
+    data = utils.parseXML(b'<MediaContainer><Part container="flac" file="a" /><Part container="flac" file="a" /></MediaContainer>')
+    first, second = [Part(elem) for elem in data]
+    assert first.container == 'flac' and first.container is second.container
+    assert first.file == second.file
+
+
+def test_utils_buildRecord():
+    from plexapi import video  # noqa: registers the library types
+    data = utils.parseXML(b'<MediaContainer><Video type="movie" key="/library/metadata/1" title="Cars" '
+        b'year="2006" /><Video type="episode" title="Pilot" grandparentTitle="The 100" /></MediaContainer>')
+    movie, episode = utils.buildItems(None, data, '/library/sections/1/all', fields=['title', 'year', 'grandparentTitle'])
+    assert movie == ('Cars', 2006, None) and movie.year == 2006
+    assert episode.title == 'Pilot' and episode.grandparentTitle == 'The 100'
+    assert utils.buildRecord(data[0]).viewCount == 0
+    with pytest.raises(BadRequest):
+        utils.buildRecord(data[0], ['media'])
+
+
+def test_utils_listColumns(fakeserver):
+    from plexapi import video  # noqa: registers the library types
+    movies = ''.join('<Video type="movie" title="Movie %s" year="%s" addedAt="1484690696">'
+        '<Media bitrate="5000"><Part size="%s" /></Media></Video>' % (i, 2000 + i, i * 10) for i in range(5))
+    server = fakeserver({'/library/sections/1/all': '<MediaContainer totalSize="5">%s</MediaContainer>' % movies})
+    columns = utils.listColumns(server, '/library/sections/1/all', ['year', 'size', 'bitrate',
+        'addedAt', 'viewCount', 'title', 'grandparentTitle'], containerSize=2, as_arrays=True)
+    assert list(columns['year']) == [2000, 2001, 2002, 2003, 2004]
+    assert list(columns['size']) == [0, 10, 20, 30, 40]
+    assert list(columns['bitrate']) == [5000] * 5
+    assert list(columns['addedAt']) == [1484690696] * 5
+    assert list(columns['viewCount']) == [0] * 5
+    assert columns['title'][4] == 'Movie 4'
+    assert columns['grandparentTitle'] == [None] * 5
+
+
+def test_utils_crawlItems(fakeserver):
+    from plexapi import video  # noqa: registers the library types
+    responses = {}
+    for path, total in (('/a', 5), ('/b', 0), ('/c', 3), ('/d', 4)):
+        movies = ''.join('<Video type="movie" title="%s%s" />' % (path, i) for i in range(total))
+        responses[path] = '<MediaContainer totalSize="%s">%s</MediaContainer>' % (total, movies)
+    responses['/d'] = responses['/d'].replace(' totalSize="4"', '')  # no totalSize reported
+    items = utils.crawlItems(fakeserver(responses), ['/a', '/b', '/c', '/d'], containerSize=2, workers=3,
+        fields=['title'])
+    assert [i.title for i in items] == ['/a0', '/a1', '/a2', '/a3', '/a4', '/c0', '/c1', '/c2',
+        '/d0', '/d1', '/d2', '/d3']
+
+
+def test_utils_PlexPartialObject_autoreload_missing(fakeserver):
+    from plexapi import video  # noqa: registers the library types
+    movie = '<Video type="movie" ratingKey="%s" key="/library/metadata/%s" title="%s" %s/>'
+    server = fakeserver({
+        '/library/sections/1/all?title=A': '<MediaContainer>%s</MediaContainer>' % (movie % (1, 1, 'A', 'year="2006" ')),
+        '/library/sections/1/all?title=B': '<MediaContainer>%s</MediaContainer>' % (movie % (2, 2, 'B', '')),
+        '/library/metadata/1': '<MediaContainer>%s</MediaContainer>' % (movie % (1, 1, 'A', 'year="2006" ')),
+        '/library/metadata/2': '<MediaContainer>%s</MediaContainer>' % (movie % (2, 2, 'B', 'tagline="hello" ')),
+    })
+    server.autoreload = 'missing'
+    a = utils.listItems(server, '/library/sections/1/all?title=A')[0]
+    b = utils.listItems(server, '/library/sections/1/all?title=B')[0]
+    assert a.tagline is utils.NA and a.isFullObject()  # the listing omits tagline: reloaded
+    assert b.tagline == 'hello'  # whatever another item of the class had
+    c = utils.listItems(server, '/library/sections/1/all?title=B')[0]
+    assert c.year is utils.NA and c.isPartialObject()  # the listing carries year: not reloaded
+    assert server.queries.count('/library/metadata/2') == 1
+    assert list(server._listedattrs) == [('Movie', '/library/sections/*/all')]
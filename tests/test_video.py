@@ -2,6 +2,7 @@
 import os, pytest
 from datetime import datetime
 from plexapi.exceptions import NotFound
+from plexapi.utils import NA, parseXML
 
 
 def test_video_Movie(a_movie_section):
@@ -31,6 +32,35 @@ def test_video_Movie_isFullObject_and_reload(pms):
     assert len(movie_via_section_search.roles) > 3
 
 
+def test_video_Movie_reload_siblings(pms):
+    movies = pms.library.section('Movies').search()
+    assert all(m.isPartialObject() for m in movies)
+    movies[0]._reloadSiblings()
+    assert all(m.isFullObject() for m in movies)
+
+
+def test_video_Movie_autoreload(pms):
+    from plexapi.server import PlexServer
+    plex = PlexServer(pms.baseurl, pms.token, autoreload='never')
+    movie = plex.library.section('Movies').search()[0]
+    assert movie.notAnAttribute is NA
+    assert movie.isPartialObject()
+    plex.autoreload = 'missing'
+    movie.notAnAttribute
+    assert movie.isFullObject()
+    assert plex.reloads[('Movie', 'notAnAttribute')] == 1
+
+
+def test_video_Movie_lazy(pms):
+    from plexapi.server import PlexServer
+    plex = PlexServer(pms.baseurl, pms.token, lazy=True)
+    movie = plex.library.section('Movies').get('Cars')
+    assert 'title' not in movie.__dict__
+    assert movie.title == 'Cars'
+    assert movie.__dict__['title'] == 'Cars'
+    assert movie.genres
+
+
 def test_video_Movie_isPartialObject(a_movie):
     assert a_movie.isPartialObject()
 
@@ -370,6 +400,15 @@ def test_video_Episode(a_show):
         a_show.episode()
     with pytest.raises(NotFound):
         a_show.episode(season=1337, episode=1337)
+    assert a_show._episodeKeys[(1, 1)] == pilot.ratingKey
+    a_show.reload()
+    assert a_show._episodeKeys[(1, 1)] == pilot.ratingKey
+    assert a_show.episode(season=1, episode=1) == pilot
+    season = a_show.season(1)
+    assert season.episode(episode=1) == pilot
+    assert season.episode(episode=1) == pilot
+    with pytest.raises(NotFound):
+        season.episode(episode=1337)
 
 
 def test_video_Episode_analyze(a_tv_section):
@@ -542,3 +581,18 @@ def test_that_reload_return_the_same_object(pms):
     episode_search_key = episode_search.key
     episode_section_get_key = episode_section_get.key
     assert episode_library_search_key == episode_library_search.reload().key == episode_search_key == episode_search.reload().key == episode_section_get_key == episode_section_get.reload().key
+
+
+def test_video_Media_parent_refs():
+    from plexapi import media
+
+    class Video(object):
+        title = 'Cars'
+    video = Video()
+    data = parseXML(b'<Media id="1"><Part id="2"><Stream id="3" streamType="1" /></Part></Media>')
+    med = media.Media(None, data, '/library/metadata/1', video)
+    part = med.parts[0]
+    assert med.video is video and part.media is med and part.streams[0].part is part
+    del video
+    assert med.video is None
+    assert repr(med) == '<Media:1>'
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Offline benchmarks for the hot paths in python-plexapi. Each benchmark runs against
+a synthetic PMS response, so no server is needed. Run one or more benchmarks with:
+
+>> python benchmark.py parsers --items 20000
+"""
+import argparse, gc, multiprocessing, resource, sys, time, tracemalloc
+from collections import Counter
+from os.path import dirname, abspath
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+from plexapi import audio, photo, playlist, utils, video  # noqa: registers the library types
+from plexapi.compat import ElementTree
+
+BENCHMARKS = {}
+
+
+def register(func):
+    BENCHMARKS[func.__name__] = func
+    return func
+
+
+def synthetic_section(items=10000):
+    """ Returns the bytes of a /library/sections/<id>/all style response holding the
+        specified number of movies (each with one Media, Part and a few streams).
+    """
+    movie = ('<Video ratingKey="%(i)s" key="/library/metadata/%(i)s" type="movie" title="Movie %(i)s" '
+        'titleSort="Movie %(i)s" studio="Studio %(s)s" contentRating="PG-13" summary="A summary for %(i)s." '
+        'year="%(y)s" duration="6000000" addedAt="1484690696" updatedAt="1484690696" viewCount="%(v)s" '
+        'librarySectionID="1" thumb="/library/metadata/%(i)s/thumb/1484690696">'
+        '<Media id="%(i)s" duration="6000000" bitrate="5000" width="1920" height="1080" aspectRatio="1.78" '
+        'audioChannels="6" audioCodec="ac3" videoCodec="h264" videoResolution="1080" container="mkv" '
+        'videoFrameRate="24p"><Part id="%(i)s" key="/library/parts/%(i)s/file.mkv" duration="6000000" '
+        'file="/media/movies/Movie %(i)s.mkv" size="%(z)s" container="mkv">'
+        '<Stream id="%(i)s1" streamType="1" codec="h264" index="0" bitrate="4500" height="1080" width="1920" />'
+        '<Stream id="%(i)s2" streamType="2" codec="ac3" index="1" channels="6" languageCode="eng" />'
+        '<Stream id="%(i)s3" streamType="3" codec="srt" index="2" languageCode="eng" />'
+        '</Part></Media><Genre tag="Action" /><Director tag="Director %(s)s" /></Video>')
+    body = ''.join(movie % {'i': i, 's': i % 50, 'y': 1950 + i % 70, 'v': i % 3, 'z': 10 ** 9 + i}
+        for i in range(1, items + 1))
+    return ('<?xml version="1.0" encoding="UTF-8"?><MediaContainer size="%s" totalSize="%s" '
+        'librarySectionID="1">%s</MediaContainer>' % (items, items, body)).encode('utf8')
+
+
+class OfflineServer(object):
+    """ Just enough of a PlexServer to build library objects from synthetic data. """
+    autoreload = 'never'
+    identityMap = None
+
+    def __init__(self, lazy=False, keepxml=True):
+        self.lazy = lazy
+        self.keepXML = keepxml
+        self.reloads = Counter()
+        self._listedattrs = {}
+
+    def url(self, path):
+        return 'http://localhost:32400%s' % path
+
+
+def synthetic_music(items=100000):
+    """ Returns the bytes of a /library/sections/<id>/all?type=10 style response holding
+        the specified number of tracks (12 per album, 10 albums per artist).
+    """
+    track = ('<Track ratingKey="%(i)s" key="/library/metadata/%(i)s" type="track" title="Track %(i)s" '
+        'index="%(n)s" parentIndex="1" parentRatingKey="%(a)s" parentKey="/library/metadata/%(a)s" '
+        'parentTitle="Album %(a)s" parentThumb="/library/metadata/%(a)s/thumb/1484690696" '
+        'grandparentRatingKey="%(r)s" grandparentKey="/library/metadata/%(r)s" '
+        'grandparentTitle="Artist %(r)s" grandparentThumb="/library/metadata/%(r)s/thumb/1484690696" '
+        'librarySectionID="2" duration="240000" addedAt="1484690696" updatedAt="1484690696">'
+        '<Media id="%(i)s" duration="240000" bitrate="1411" audioChannels="2" audioCodec="flac" '
+        'container="flac"><Part id="%(i)s" key="/library/parts/%(i)s/file.flac" duration="240000" '
+        'file="/media/music/Artist %(r)s/Album %(a)s/%(n)02d.flac" size="%(z)s" container="flac" />'
+        '</Media></Track>')
+    body = ''.join(track % {'i': i, 'n': i % 12 + 1, 'a': 10 ** 7 + i // 12, 'r': 10 ** 8 + i // 120,
+        'z': 3 * 10 ** 7 + i} for i in range(1, items + 1))
+    return ('<?xml version="1.0" encoding="UTF-8"?><MediaContainer size="%s" totalSize="%s" '
+        'librarySectionID="2">%s</MediaContainer>' % (items, items, body)).encode('utf8')
+
+
+def _maxrss():
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def _isolated(func, *args):
+    # Run func in a fresh process so peak memory of one run doesn't hide the next.
+    pool = multiprocessing.Pool(1)
+    try:
+        return pool.apply(func, args)
+    finally:
+        pool.terminate()
+
+
+def _parse(parser, data, repeat):
+    before = _maxrss()
+    start = time.time()
+    for i in range(repeat):
+        root = utils.parseXML(data, parser)
+    elapsed = (time.time() - start) / repeat
+    return elapsed, _maxrss() - before, len(root)
+
+
+@register
+def parsers(opts):
+    """ Parse speed (MB/s) and peak memory of each available XML parser backend. """
+    data = synthetic_section(opts.items)
+    print('%s bytes, %s items' % (len(data), opts.items))
+    for parser in sorted(utils.XML_PARSERS):
+        elapsed, peak, size = _isolated(_parse, parser, data, opts.repeat)
+        print('  %-6s %8.1f MB/s  %8.1f MB peak  (%s items)' % (parser,
+            len(data) / elapsed / 2 ** 20, peak / 2 ** 20, size))
+
+
+def _items(server, root, full):
+    # Full objects are built from their own key, as if each was fetched by itself.
+    if full:
+        return [utils.buildItem(server, elem, elem.attrib['key']) for elem in root]
+    return utils.buildItems(server, root, '/library/sections/1/all')
+
+
+def _build(server, root, full, repeat):
+    start = time.time()
+    for i in range(repeat):
+        items = _items(server, root, full)
+    return (time.time() - start) / repeat, len(items)
+
+
+@register
+def objects(opts):
+    """ Objects built per second from a parsed section, partial vs full and eager vs lazy. """
+    root = utils.parseXML(synthetic_section(opts.items))
+    for full in (False, True):
+        for lazy in (False, True):
+            elapsed, size = _build(OfflineServer(lazy), root, full, opts.repeat)
+            print('  %-7s %-5s %10.0f objects/s  (%s items)' % ('full' if full else 'partial',
+                'lazy' if lazy else 'eager', size / elapsed, size))
+
+
+def _retained(items, lazy, keepxml):
+    # Bytes still allocated by the built objects once the parsed response is dropped.
+    data = synthetic_section(items)
+    tracemalloc.start()
+    root = utils.parseXML(data)
+    built = _items(OfflineServer(lazy, keepxml), root, True)
+    del root
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, len(built)
+
+
+@register
+def memory(opts):
+    """ Bytes retained per full item (with its media, parts, streams and tags). """
+    for lazy, keepxml in ((False, True), (False, False), (True, True)):
+        size, count = _isolated(_retained, opts.items, lazy, keepxml)
+        print('  %-5s %-9s %8.0f bytes/item  (%s items)' % ('lazy' if lazy else 'eager',
+            'keepxml' if keepxml else 'dropxml', size / count, count))
+
+
+def _retainedRecords(items, fields, as_records):
+    data = synthetic_section(items)
+    root = utils.parseXML(data)
+    start = time.time()
+    built = utils.buildItems(OfflineServer(), root, '/library/sections/1/all', fields=fields,
+        as_records=as_records)
+    elapsed = time.time() - start
+    tracemalloc.start()
+    built = utils.buildItems(OfflineServer(), root, '/library/sections/1/all', fields=fields,
+        as_records=as_records)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return elapsed, size, len(built)
+
+
+@register
+def records(opts):
+    """ Build speed and memory of records vs objects for a section listing. """
+    fields = ['ratingKey', 'title', 'year', 'duration', 'viewCount']
+    for label, args in (('objects', (None, False)), ('records', (None, True)), ('fields', (fields, False))):
+        elapsed, size, count = _isolated(_retainedRecords, opts.items, *args)
+        print('  %-8s %10.0f items/s  %6.0f bytes/item  (%s items)' % (label, count / elapsed,
+            size / count, count))
+
+
+class PagedServer(OfflineServer):
+    """ OfflineServer answering paged requests for a synthetic section. Pages are parsed
+        up front, so only building the results is measured.
+    """
+
+    def __init__(self, data, size):
+        super(PagedServer, self).__init__()
+        root = utils.parseXML(data)
+        self.pages = {}
+        for start in range(0, len(root), size):
+            page = ElementTree.Element('MediaContainer', size=str(size), totalSize=str(len(root)))
+            page.extend(list(root)[start:start + size])
+            self.pages[start] = utils.parseXML(ElementTree.tostring(page))
+
+    def queryPage(self, path, start, size):
+        return self.pages[start]
+
+
+@register
+def columns(opts):
+    """ Items/s scanning a few numeric columns of a section: objects vs columns. """
+    server = PagedServer(synthetic_section(opts.items), 1000)
+    columns = ['duration', 'size', 'bitrate', 'year', 'addedAt', 'viewCount']
+    start = time.time()
+    items = utils.listPagedItems(server, '/library/sections/1/all', containerSize=1000)
+    rows = [(i.duration, i.year, i.addedAt, i.viewCount) for i in items]
+    print('  objects  %10.0f items/s  (%s items)' % (len(rows) / (time.time() - start), len(rows)))
+    for as_arrays in (False, True):
+        start = time.time()
+        result = utils.listColumns(server, '/library/sections/1/all', columns, containerSize=1000,
+            as_arrays=as_arrays)
+        print('  %-8s %10.0f items/s  (%s items)' % ('arrays' if as_arrays else 'lists',
+            len(result['year']) / (time.time() - start), len(result['year'])))
+
+
+def _subclasses(cls):
+    for subcls in cls.__subclasses__():
+        yield subcls
+        for subsubcls in _subclasses(subcls):
+            yield subsubcls
+
+
+def _retainedTracks(items, interned):
+    if not interned:
+        for cls in set(_subclasses(utils.PlexObject)):
+            for field in cls._fields.values():
+                field.intern = False
+            cls._load = utils._compileLoader(cls)
+    data = synthetic_music(items)
+    tracemalloc.start()
+    root = utils.parseXML(data)
+    built = utils.buildItems(OfflineServer(), root, '/library/sections/2/all')
+    del root
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, len(built)
+
+
+@register
+def interning(opts):
+    """ Memory saved by interning repeated attribute values of a music section. """
+    plain, count = _isolated(_retainedTracks, opts.items, False)
+    interned, count = _isolated(_retainedTracks, opts.items, True)
+    print('  %s tracks: %.1f MB -> %.1f MB, saved %.1f MB (%.0f bytes/track)' % (count,
+        plain / 2 ** 20, interned / 2 ** 20, (plain - interned) / 2 ** 20, (plain - interned) / count))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('benchmarks', nargs='*', default=sorted(BENCHMARKS), help='Benchmarks to run.')
+    parser.add_argument('--items', type=int, default=10000, help='Items in the synthetic library.')
+    parser.add_argument('--repeat', type=int, default=3, help='Times to repeat each measurement.')
+    opts = parser.parse_args()
+    for name in opts.benchmarks:
+        print('%s: %s' % (name, BENCHMARKS[name].__doc__.strip()))
+        BENCHMARKS[name](opts)